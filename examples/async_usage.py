@@ -9,18 +9,14 @@ async def main() -> None:
     """Demonstrate async API usage."""
     # Use async context manager
     async with KuberaClient() as client:
-        # Fetch all portfolios asynchronously
-        portfolios = await client.aget_portfolios()
-        print(f"Found {len(portfolios)} portfolios")
-
-        # Fetch multiple portfolios concurrently
-        if portfolios:
-            tasks = [client.aget_portfolio(p["id"]) for p in portfolios]
-            portfolio_data = await asyncio.gather(*tasks)
-
-            for portfolio in portfolio_data:
-                net_worth = portfolio.get("net_worth", {})
-                print(f"{portfolio['name']}: {net_worth.get('amount', 0)} {portfolio['currency']}")
+        # Fetch every portfolio's details concurrently over the client's shared
+        # connection pool, with a bounded number of requests in flight
+        portfolio_data = await client.aget_all_portfolios(concurrency=5)
+        print(f"Found {len(portfolio_data)} portfolios")
+
+        for portfolio in portfolio_data:
+            net_worth = portfolio.get("net_worth", {})
+            print(f"{portfolio['name']}: {net_worth.get('amount', 0)} {portfolio['currency']}")
 
         # Update an item asynchronously
         # item_id = "your_asset_or_debt_id"
@@ -1,6 +1,7 @@
 """Kubera API - Modern Python client for the Kubera Data API v3."""
 
-from kubera.client import KuberaClient
+from typing import TYPE_CHECKING, Any
+
 from kubera.exceptions import (
     KuberaAPIError,
     KuberaAuthenticationError,
@@ -8,6 +9,9 @@ from kubera.exceptions import (
     KuberaValidationError,
 )
 
+if TYPE_CHECKING:
+    from kubera.client import KuberaClient
+
 __version__ = "0.1.0"
 __all__ = [
     "KuberaClient",
@@ -16,3 +20,12 @@ __all__ = [
     "KuberaRateLimitError",
     "KuberaValidationError",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import the client lazily so importing the package doesn't load httpx."""
+    if name == "KuberaClient":
+        from kubera.client import KuberaClient
+
+        return KuberaClient
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,50 @@
+"""Compact JSON encoding shared by the client, cache, and formatters.
+
+orjson is used when the optional ``fast`` extra is installed; the stdlib
+fallback is configured to produce the same bytes.
+"""
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised only without the optional extra
+    orjson = None  # type: ignore[assignment]
+
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so this catches both
+JSONDecodeError = json.JSONDecodeError
+
+__all__ = ["JSONDecodeError", "dumps", "loads", "orjson"]
+
+
+def dumps(data: Any) -> bytes:
+    """Serialize data as compact JSON.
+
+    The stdlib fallback emits no spaces and leaves non-ASCII unescaped, so
+    request signatures do not depend on which encoder is available.
+
+    Args:
+        data: JSON-serializable data
+
+    Returns:
+        Compact UTF-8 encoded JSON
+    """
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+def loads(raw: bytes) -> Any:
+    """Parse UTF-8 encoded JSON.
+
+    Args:
+        raw: UTF-8 encoded JSON
+
+    Returns:
+        Parsed data
+
+    Raises:
+        JSONDecodeError: If the input is not valid JSON
+    """
+    return orjson.loads(raw) if orjson is not None else json.loads(raw)
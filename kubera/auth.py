@@ -1,19 +1,53 @@
 """Authentication utilities for Kubera API."""
 
+import functools
 import hashlib
 import hmac
-import json
 import time
 from typing import Any
 
+from kubera._json import dumps
+
+# Bound once so the signing path doesn't repeat the module attribute lookup
+_SHA256 = hashlib.sha256
+
+
+@functools.lru_cache(maxsize=128)
+def _encode(value: str) -> bytes:
+    """UTF-8 encode an invariant signature fragment (API key, method, path).
+
+    Args:
+        value: String to encode
+
+    Returns:
+        Encoded bytes
+    """
+    return value.encode("utf-8")
+
+
+def create_hmac_template(secret: str) -> hmac.HMAC:
+    """Create a pre-keyed HMAC-SHA256 object for repeated signing.
+
+    Deriving the inner/outer key pads is done once here; callers sign each
+    request by copying the template rather than keying a new HMAC.
+
+    Args:
+        secret: Your Kubera API secret
+
+    Returns:
+        HMAC object keyed with the secret and no message data
+    """
+    return hmac.new(secret.encode("utf-8"), b"", _SHA256)
+
 
 def generate_signature(
     api_key: str,
     secret: str,
     http_method: str,
     request_path: str,
-    body: dict[str, Any] | None = None,
+    body: dict[str, Any] | bytes | None = None,
     timestamp: str | None = None,
+    hmac_template: hmac.HMAC | None = None,
 ) -> tuple[str, str]:
     """Generate HMAC-SHA256 signature for Kubera API authentication.
 
@@ -22,25 +56,45 @@ def generate_signature(
         secret: Your Kubera API secret
         http_method: HTTP method (GET, POST, etc.)
         request_path: API endpoint path (e.g., /api/v3/data/portfolio)
-        body: Request body dictionary (for POST requests)
+        body: Request body dictionary (for POST requests), or the already
+            serialized compact JSON that will be sent
         timestamp: Unix timestamp in seconds (auto-generated if None)
+        hmac_template: Pre-keyed HMAC object to copy instead of re-deriving
+            the key pads from ``secret`` (see :func:`create_hmac_template`)
 
     Returns:
         Tuple of (signature, timestamp)
     """
     if timestamp is None:
-        timestamp = str(int(time.time()))
+        timestamp = str(time.time_ns() // 1_000_000_000)
 
     # Prepare body data (compact JSON with no spaces)
-    body_data = ""
-    if body is not None:
-        body_data = json.dumps(body, separators=(",", ":"))
+    body_data = b""
+    if isinstance(body, bytes):
+        body_data = body
+    elif body is not None:
+        body_data = dumps(body)
 
-    # Create signature data string
-    data = f"{api_key}{timestamp}{http_method}{request_path}{body_data}"
+    # Create signature data from encoded fragments
+    data = b"".join(
+        (
+            _encode(api_key),
+            timestamp.encode("utf-8"),
+            _encode(http_method),
+            _encode(request_path),
+            body_data,
+        )
+    )
 
     # Generate HMAC-SHA256 signature
-    signature = hmac.new(secret.encode("utf-8"), data.encode("utf-8"), hashlib.sha256).hexdigest()
+    if hmac_template is not None:
+        h = hmac_template.copy()
+        h.update(data)
+        signature = h.digest().hex()
+    else:
+        # One-shot digest runs entirely inside OpenSSL (SHA-NI accelerated where
+        # the platform build supports it) without creating a Python HMAC object
+        signature = hmac.digest(secret.encode("utf-8"), data, _SHA256).hex()
 
     return signature, timestamp
 
@@ -50,7 +104,8 @@ def create_auth_headers(
     secret: str,
     http_method: str,
     request_path: str,
-    body: dict[str, Any] | None = None,
+    body: dict[str, Any] | bytes | None = None,
+    hmac_template: hmac.HMAC | None = None,
 ) -> dict[str, str]:
     """Create authentication headers for Kubera API request.
 
@@ -59,12 +114,15 @@ def create_auth_headers(
         secret: Your Kubera API secret
         http_method: HTTP method (GET, POST, etc.)
         request_path: API endpoint path
-        body: Request body dictionary (for POST requests)
+        body: Request body dictionary or serialized JSON (for POST requests)
+        hmac_template: Pre-keyed HMAC object to reuse for signing
 
     Returns:
         Dictionary of authentication headers
     """
-    signature, timestamp = generate_signature(api_key, secret, http_method, request_path, body)
+    signature, timestamp = generate_signature(
+        api_key, secret, http_method, request_path, body, hmac_template=hmac_template
+    )
 
     return {
         "x-api-token": api_key,
@@ -1,9 +1,33 @@
 """Cache management for portfolio ID mapping."""
 
-import json
+import functools
+import os
+import re
+import tempfile
+import time
+from collections.abc import Iterable
 from pathlib import Path
 from typing import Any
 
+from kubera._json import JSONDecodeError, dumps, loads
+
+# How long a cached portfolio detail response stays fresh, in seconds
+DETAIL_MAX_AGE = 300
+
+# Portfolio IDs safe to embed in a cache file name
+_SAFE_ID = re.compile(r"[A-Za-z0-9_-]+")
+
+
+def get_cache_dir() -> Path:
+    """Get the cache directory, creating it if needed.
+
+    Returns:
+        Path to the cache directory
+    """
+    cache_dir = Path.home() / ".kubera"
+    cache_dir.mkdir(exist_ok=True)
+    return cache_dir
+
 
 def get_cache_file() -> Path:
     """Get the cache file path.
@@ -11,9 +35,31 @@ def get_cache_file() -> Path:
     Returns:
         Path to the cache file
     """
-    cache_dir = Path.home() / ".kubera"
-    cache_dir.mkdir(exist_ok=True)
-    return cache_dir / "portfolio_cache.json"
+    return get_cache_dir() / "portfolio_cache.json"
+
+
+def _write_atomic(path: Path, payload: bytes) -> None:
+    """Write a file via a uniquely named temp file and rename.
+
+    An interrupted write never leaves a truncated file behind, and concurrent
+    writers never share a temp file. The file is only readable by the current
+    user from the moment it is created.
+
+    Args:
+        path: Destination path
+        payload: File contents
+    """
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as tmp_file:
+            tmp_file.write(payload)
+        os.replace(tmp_name, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_name)
+        except OSError:
+            pass
+        raise
 
 
 def save_portfolio_cache(portfolios: list[dict[str, Any]]) -> None:
@@ -33,26 +79,140 @@ def save_portfolio_cache(portfolios: list[dict[str, Any]]) -> None:
             for p in portfolios
         ]
     }
-    with open(cache_file, "w") as f:
-        json.dump(cache_data, f, indent=2)
+    # Compact encoding - the file is only read back by load_portfolio_cache()
+    _write_atomic(cache_file, dumps(cache_data))
+    # A rewrite can land in the same mtime tick, so don't trust the memo to notice
+    _load_raw.cache_clear()
+
+
+@functools.lru_cache(maxsize=4)
+def _load_raw(path: Path, signature: tuple[int, int, int]) -> tuple[dict[str, Any], ...]:
+    """Read and parse the cache file, memoized on its stat signature.
+
+    Args:
+        path: Path to the cache file
+        signature: Modification time, inode and size of the file, used only as
+            part of the cache key
+
+    Returns:
+        Tuple of cached portfolios
+    """
+    try:
+        cache_data = loads(path.read_bytes())
+        return tuple(cache_data.get("portfolios", []))
+    except (JSONDecodeError, OSError):
+        return ()
 
 
 def load_portfolio_cache() -> list[dict[str, Any]]:
     """Load portfolio list from cache.
 
+    The parsed file is kept in memory and only re-read when its modification
+    time, inode or size changes.
+
     Returns:
         List of cached portfolios, or empty list if cache doesn't exist
     """
     cache_file = get_cache_file()
-    if not cache_file.exists():
+    try:
+        stat = cache_file.stat()
+    except OSError:
         return []
 
+    signature = (stat.st_mtime_ns, stat.st_ino, stat.st_size)
+    # Copy so callers can't mutate the memoized entries
+    return [dict(p) for p in _load_raw(cache_file, signature)]
+
+
+def get_detail_dir() -> Path:
+    """Get the directory holding cached portfolio detail responses.
+
+    Kept apart from the portfolio index so no portfolio ID can name a file
+    that collides with it.
+
+    Returns:
+        Path to the detail cache directory (not created)
+    """
+    return get_cache_dir() / "details"
+
+
+def _detail_file(portfolio_id: str) -> Path | None:
+    """Get the cache file path for a portfolio's detail response.
+
+    Args:
+        portfolio_id: The portfolio ID
+
+    Returns:
+        Path to the detail cache file, or None if the ID isn't file-name safe
+    """
+    if not _SAFE_ID.fullmatch(portfolio_id):
+        return None
+    return get_detail_dir() / f"{portfolio_id}.json"
+
+
+def save_portfolio_detail(portfolio_id: str, portfolio: dict[str, Any]) -> None:
+    """Save a portfolio detail response to the on-disk cache.
+
+    Args:
+        portfolio_id: The portfolio ID
+        portfolio: Portfolio data as returned by the API
+    """
+    detail_file = _detail_file(portfolio_id)
+    if detail_file is None:
+        return
     try:
-        with open(cache_file) as f:
-            cache_data = json.load(f)
-            return cache_data.get("portfolios", [])
-    except (json.JSONDecodeError, OSError):
-        return []
+        detail_file.parent.mkdir(exist_ok=True)
+        _write_atomic(detail_file, dumps(portfolio))
+    except OSError:
+        pass
+
+
+def load_portfolio_detail(
+    portfolio_id: str, max_age: float = DETAIL_MAX_AGE
+) -> dict[str, Any] | None:
+    """Load a cached portfolio detail response if it is still fresh.
+
+    Args:
+        portfolio_id: The portfolio ID
+        max_age: Maximum age of the cached response in seconds
+
+    Returns:
+        Cached portfolio data, or None if missing, stale, or unreadable
+    """
+    detail_file = _detail_file(portfolio_id)
+    if detail_file is None:
+        return None
+    try:
+        if time.time() - detail_file.stat().st_mtime > max_age:
+            return None
+        portfolio = loads(detail_file.read_bytes())
+    except (JSONDecodeError, OSError):
+        return None
+    return portfolio if isinstance(portfolio, dict) else None
+
+
+def clear_portfolio_details() -> None:
+    """Remove every cached portfolio detail response.
+
+    Used after a write, when the affected portfolio isn't known.
+    """
+    for detail_file in get_detail_dir().glob("*.json"):
+        try:
+            detail_file.unlink()
+        except OSError:
+            pass
+
+
+def _looks_like_guid(value: str) -> bool:
+    """Check for a 36-char GUID with hyphens at positions 8, 13, 18, 23.
+
+    Args:
+        value: Candidate portfolio identifier
+
+    Returns:
+        True if the value has the GUID layout
+    """
+    return len(value) == 36 and value[8] == value[13] == value[18] == value[23] == "-"
 
 
 def resolve_portfolio_id(id_or_index: str) -> str | None:
@@ -64,17 +224,36 @@ def resolve_portfolio_id(id_or_index: str) -> str | None:
     Returns:
         Portfolio ID if found, None otherwise
     """
-    # Check if it looks like a GUID (contains hyphens and is 36 chars)
-    if "-" in id_or_index and len(id_or_index) == 36:
-        return id_or_index
+    return resolve_portfolio_id_batch([id_or_index])[0]
 
-    # Try to parse as an index
-    try:
-        index = int(id_or_index)
-        portfolios = load_portfolio_cache()
-        if 1 <= index <= len(portfolios):
-            return portfolios[index - 1]["id"]
-    except (ValueError, IndexError, KeyError):
-        pass
 
-    return None
+def resolve_portfolio_id_batch(ids_or_indexes: Iterable[str]) -> list[str | None]:
+    """Resolve several portfolio indexes or IDs with at most one cache load.
+
+    Args:
+        ids_or_indexes: Numeric indexes (1, 2, 3...) and/or portfolio IDs (GUIDs)
+
+    Returns:
+        Portfolio ID (or None if not found) for each input, in order
+    """
+    portfolios: list[dict[str, Any]] | None = None
+    resolved: list[str | None] = []
+
+    for id_or_index in ids_or_indexes:
+        if _looks_like_guid(id_or_index):
+            resolved.append(id_or_index)
+            continue
+
+        # Try to parse as an index, loading the cache on first use
+        portfolio_id = None
+        try:
+            index = int(id_or_index)
+            if portfolios is None:
+                portfolios = load_portfolio_cache()
+            if 1 <= index <= len(portfolios):
+                portfolio_id = portfolios[index - 1]["id"]
+        except (ValueError, IndexError, KeyError):
+            pass
+        resolved.append(portfolio_id)
+
+    return resolved
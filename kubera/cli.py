@@ -1,22 +1,36 @@
 """Command-line interface for Kubera API."""
 
 import sys
-from typing import Any
+from collections.abc import Iterable
+from typing import TYPE_CHECKING, Any
 
 import click
 
-from kubera.cache import resolve_portfolio_id, save_portfolio_cache
-from kubera.client import KuberaClient
-from kubera.exceptions import KuberaAPIError
-from kubera.formatters import (
-    print_asset_tree,
-    print_error,
-    print_item,
-    print_portfolio,
-    print_portfolios,
-    print_sheet_detail,
-    print_success,
+from kubera.cache import (
+    clear_portfolio_details,
+    load_portfolio_detail,
+    resolve_portfolio_id,
+    save_portfolio_cache,
+    save_portfolio_detail,
 )
+from kubera.exceptions import KuberaAPIError
+
+# Portfolio keys to look up for each drill category, in preference order
+# (the API uses singular keys; plural forms are accepted as a fallback)
+_CATEGORY_KEYS: dict[str, tuple[str, ...]] = {
+    "asset": ("asset", "assets"),
+    "debt": ("debt", "debts"),
+    "insurance": ("insurance",),
+}
+
+# Number of portfolios whose details `kubera test` fetches concurrently
+TEST_SAMPLE_SIZE = 3
+
+# The HTTP client (httpx), Rich formatters and asyncio are imported inside the
+# commands that use them so `kubera --help`, `--version` and shell completion stay
+# fast; each command only pays for what it runs.
+if TYPE_CHECKING:
+    from kubera.client import KuberaClient
 
 
 @click.group()
@@ -50,9 +64,13 @@ def cli(ctx: click.Context, api_key: str | None, secret: str | None) -> None:
     ctx.obj["secret"] = secret
 
 
-def get_client(ctx: click.Context) -> KuberaClient:
+def get_client(ctx: click.Context) -> "KuberaClient":
     """Get or create a Kubera client from context.
 
+    The client is shared by every command run under the same root context and
+    closed once when that context is torn down, so chained operations reuse its
+    connection pool.
+
     Args:
         ctx: Click context
 
@@ -63,6 +81,9 @@ def get_client(ctx: click.Context) -> KuberaClient:
         SystemExit: If client initialization fails
     """
     if "client" not in ctx.obj:
+        from kubera.client import KuberaClient
+        from kubera.formatters import print_error
+
         try:
             ctx.obj["client"] = KuberaClient(
                 api_key=ctx.obj.get("api_key"), secret=ctx.obj.get("secret")
@@ -70,9 +91,62 @@ def get_client(ctx: click.Context) -> KuberaClient:
         except KuberaAPIError as e:
             print_error(f"Failed to initialize client: {e.message}")
             sys.exit(1)
+        ctx.find_root().call_on_close(ctx.obj["client"].close)
     return ctx.obj["client"]
 
 
+def fetch_portfolio(
+    client: "KuberaClient", portfolio_id: str, use_cache: bool = True
+) -> dict[str, Any]:
+    """Fetch portfolio details, reusing a recently cached response.
+
+    Args:
+        client: Kubera client used on a cache miss
+        portfolio_id: The resolved portfolio ID
+        use_cache: If False, always fetch from the API
+
+    Returns:
+        Portfolio data
+
+    Raises:
+        KuberaAPIError: If the API request fails
+    """
+    if use_cache:
+        cached = load_portfolio_detail(portfolio_id)
+        if cached is not None:
+            return cached
+
+    portfolio: dict[str, Any] = client.get_portfolio(portfolio_id)  # type: ignore[assignment]
+    save_portfolio_detail(portfolio_id, portfolio)
+    return portfolio
+
+
+def fetch_portfolios_concurrently(client: "KuberaClient", portfolio_ids: Iterable[str]) -> Any:
+    """Fetch details for several portfolios concurrently from synchronous code.
+
+    Args:
+        client: Kubera client whose async methods are used
+        portfolio_ids: Portfolio IDs to fetch
+
+    Returns:
+        List of portfolio data in the same order as the IDs
+
+    Raises:
+        KuberaAPIError: If any API request fails
+    """
+    # asyncio adds ~50ms to CLI startup and only `kubera test` needs it
+    import asyncio
+
+    async def _gather() -> Any:
+        try:
+            return await asyncio.gather(*(client.aget_portfolio(pid) for pid in portfolio_ids))
+        finally:
+            # The async client is bound to this event loop, so close it before it ends
+            await client.aclose()
+
+    return asyncio.run(_gather())
+
+
 @cli.command()
 @click.option("--raw", is_flag=True, help="Output raw JSON instead of formatted text")
 @click.pass_context
@@ -86,6 +160,8 @@ def list(ctx: click.Context, raw: bool) -> None:
         kubera list
         kubera list --raw
     """
+    from kubera.formatters import print_error, print_portfolios
+
     client = get_client(ctx)
 
     try:
@@ -96,16 +172,15 @@ def list(ctx: click.Context, raw: bool) -> None:
     except KuberaAPIError as e:
         print_error(f"Failed to fetch portfolios: {e.message}")
         sys.exit(1)
-    finally:
-        client.close()
 
 
 @cli.command()
 @click.argument("portfolio_id")
 @click.option("--raw", is_flag=True, help="Output raw JSON instead of formatted text")
 @click.option("--tree", is_flag=True, help="Show as tree view")
+@click.option("--no-cache", is_flag=True, help="Fetch fresh data instead of using the cache")
 @click.pass_context
-def show(ctx: click.Context, portfolio_id: str, raw: bool, tree: bool) -> None:
+def show(ctx: click.Context, portfolio_id: str, raw: bool, tree: bool, no_cache: bool) -> None:
     """Show detailed portfolio information.
 
     Displays comprehensive information about a specific portfolio including:
@@ -122,7 +197,12 @@ def show(ctx: click.Context, portfolio_id: str, raw: bool, tree: bool) -> None:
         kubera show abc123
         kubera show 1 --raw
         kubera show 2 --tree
+        kubera show 1 --no-cache
+
+    Portfolio details are cached for 5 minutes; use --no-cache to refetch.
     """
+    from kubera.formatters import print_asset_tree, print_error, print_portfolio
+
     client = get_client(ctx)
 
     try:
@@ -135,17 +215,15 @@ def show(ctx: click.Context, portfolio_id: str, raw: bool, tree: bool) -> None:
             )
             sys.exit(1)
 
-        portfolio = client.get_portfolio(resolved_id)
+        portfolio = fetch_portfolio(client, resolved_id, use_cache=not no_cache)
 
         if tree:
-            print_asset_tree(portfolio)  # type: ignore[arg-type]
+            print_asset_tree(portfolio)
         else:
-            print_portfolio(portfolio, raw=raw)  # type: ignore[arg-type]
+            print_portfolio(portfolio, raw=raw)
     except KuberaAPIError as e:
         print_error(f"Failed to fetch portfolio: {e.message}")
         sys.exit(1)
-    finally:
-        client.close()
 
 
 @cli.command()
@@ -153,8 +231,16 @@ def show(ctx: click.Context, portfolio_id: str, raw: bool, tree: bool) -> None:
 @click.argument("category")
 @click.argument("sheet_name")
 @click.option("--raw", is_flag=True, help="Output raw JSON instead of formatted text")
+@click.option("--no-cache", is_flag=True, help="Fetch fresh data instead of using the cache")
 @click.pass_context
-def drill(ctx: click.Context, portfolio_id: str, category: str, sheet_name: str, raw: bool) -> None:
+def drill(
+    ctx: click.Context,
+    portfolio_id: str,
+    category: str,
+    sheet_name: str,
+    raw: bool,
+    no_cache: bool,
+) -> None:
     """Drill down into a specific sheet within a category.
 
     Shows detailed information for all items in a specific sheet, including:
@@ -172,7 +258,10 @@ def drill(ctx: click.Context, portfolio_id: str, category: str, sheet_name: str,
         kubera drill 1 asset "Bank Accounts"
         kubera drill 2 asset "Investments"
         kubera drill 1 debt "Credit Cards"
+        kubera drill 1 asset "Investments" --no-cache
     """
+    from kubera.formatters import print_error, print_sheet_detail
+
     client = get_client(ctx)
 
     try:
@@ -185,26 +274,21 @@ def drill(ctx: click.Context, portfolio_id: str, category: str, sheet_name: str,
             )
             sys.exit(1)
 
-        portfolio = client.get_portfolio(resolved_id)
+        portfolio = fetch_portfolio(client, resolved_id, use_cache=not no_cache)
 
         # Get the items from the specified category
-        items: Any
-        if category.lower() == "asset":
-            items = portfolio.get("asset", portfolio.get("assets", []))
-        elif category.lower() == "debt":
-            items = portfolio.get("debt", portfolio.get("debts", []))
-        elif category.lower() == "insurance":
-            items = portfolio.get("insurance", [])
-        else:
+        keys = _CATEGORY_KEYS.get(category.casefold())
+        if keys is None:
             print_error(f"Invalid category: {category}. Use 'asset', 'debt', or 'insurance'")
             sys.exit(1)
+        items: Any = next((portfolio.get(k) for k in keys if k in portfolio), [])
 
         # Filter items by sheet name (case-insensitive)
+        target = sheet_name.casefold()
         sheet_items = [
             item
             for item in items
-            if isinstance(item.get("sheetName"), str)
-            and item.get("sheetName", "").lower() == sheet_name.lower()
+            if isinstance(name := item.get("sheetName"), str) and name.casefold() == target
         ]
 
         if not sheet_items:
@@ -221,8 +305,6 @@ def drill(ctx: click.Context, portfolio_id: str, category: str, sheet_name: str,
     except KuberaAPIError as e:
         print_error(f"Failed to fetch portfolio: {e.message}")
         sys.exit(1)
-    finally:
-        client.close()
 
 
 @cli.command()
@@ -257,6 +339,8 @@ def update(
         kubera update item123 --name "Updated Name" --description "New description"
         kubera update item123 --value 50000 --cost 45000
     """
+    from kubera.formatters import print_error, print_item, print_success
+
     client = get_client(ctx)
 
     # Build updates dictionary
@@ -276,13 +360,13 @@ def update(
 
     try:
         updated_item = client.update_item(item_id, updates)  # type: ignore
+        # The item's portfolio isn't known here, so drop every cached detail response
+        clear_portfolio_details()
         print_success(f"Successfully updated item: {updated_item.get('name', item_id)}")
         print_item(updated_item, raw=raw)
     except KuberaAPIError as e:
         print_error(f"Failed to update item: {e.message}")
         sys.exit(1)
-    finally:
-        client.close()
 
 
 @cli.command()
@@ -298,7 +382,7 @@ def test(ctx: click.Context, raw: bool) -> None:
         kubera test              # Human-readable output
         kubera test --raw        # JSON output
     """
-    import json
+    from kubera.formatters import print_error, print_json, print_success
 
     client = get_client(ctx)
 
@@ -317,28 +401,29 @@ def test(ctx: click.Context, raw: bool) -> None:
             print_success(f"✓ Found {len(portfolios)} portfolio(s)")
 
             if portfolios:
-                click.echo("\nPortfolios:")
-                for i, portfolio in enumerate(portfolios, 1):
-                    click.echo(
-                        f"  {i}. {portfolio['name']} "
-                        f"(ID: {portfolio['id']}, Currency: {portfolio['currency']})"
-                    )
-
-                # Test 2: Fetch detailed data for first portfolio
-                click.echo("\n→ Fetching detailed data for first portfolio...")
-                portfolio_id = portfolios[0]["id"]
-                portfolio_data = client.get_portfolio(portfolio_id)
-
-                print_success(f"✓ Portfolio: {portfolio_data['name']}")
-                click.echo(f"  - Assets: {len(portfolio_data.get('assets', []))}")
-                click.echo(f"  - Debts: {len(portfolio_data.get('debts', []))}")
-                click.echo(f"  - Insurance: {len(portfolio_data.get('insurance', []))}")
-
-                net_worth = portfolio_data.get("net_worth", {})
-                if net_worth:
-                    amount = net_worth.get("amount", "N/A")
-                    currency = portfolio_data["currency"]
-                    click.echo(f"  - Net Worth: {amount} {currency}")
+                lines = [
+                    f"  {i}. {portfolio['name']} "
+                    f"(ID: {portfolio['id']}, Currency: {portfolio['currency']})"
+                    for i, portfolio in enumerate(portfolios, 1)
+                ]
+                click.echo("\nPortfolios:\n" + "\n".join(lines))
+
+                # Test 2: Fetch detailed data for the first few portfolios concurrently
+                sample = portfolios[:TEST_SAMPLE_SIZE]
+                click.echo(f"\n→ Fetching detailed data for {len(sample)} portfolio(s)...")
+                sample_data = fetch_portfolios_concurrently(client, (p["id"] for p in sample))
+
+                for portfolio_data in sample_data:
+                    print_success(f"✓ Portfolio: {portfolio_data['name']}")
+                    click.echo(f"  - Assets: {len(portfolio_data.get('assets', []))}")
+                    click.echo(f"  - Debts: {len(portfolio_data.get('debts', []))}")
+                    click.echo(f"  - Insurance: {len(portfolio_data.get('insurance', []))}")
+
+                    net_worth = portfolio_data.get("net_worth", {})
+                    if net_worth:
+                        amount = net_worth.get("amount", "N/A")
+                        currency = portfolio_data["currency"]
+                        click.echo(f"  - Net Worth: {amount} {currency}")
 
                 click.echo("\n" + "=" * 50)
                 print_success("✓ All tests passed! Your Kubera API client is working correctly.")
@@ -355,11 +440,12 @@ def test(ctx: click.Context, raw: bool) -> None:
             }
 
             if portfolios:
-                portfolio_id = portfolios[0]["id"]
-                portfolio_data = client.get_portfolio(portfolio_id)
-                result["sample_portfolio"] = portfolio_data
+                sample = portfolios[:TEST_SAMPLE_SIZE]
+                sample_data = fetch_portfolios_concurrently(client, (p["id"] for p in sample))
+                result["sample_portfolio"] = sample_data[0]
+                result["portfolios_checked"] = len(sample_data)
 
-            click.echo(json.dumps(result, indent=2))
+            print_json(result)
 
     except KuberaAPIError as e:
         if raw:
@@ -368,7 +454,7 @@ def test(ctx: click.Context, raw: bool) -> None:
                 "error": e.message,
                 "status_code": e.status_code,
             }
-            click.echo(json.dumps(error_data, indent=2))
+            print_json(error_data)
         else:
             print_error(f"✗ API Error: {e.message}")
             if e.status_code:
@@ -386,15 +472,13 @@ def test(ctx: click.Context, raw: bool) -> None:
     except Exception as e:
         if raw:
             error_data = {"status": "error", "error": str(e)}
-            click.echo(json.dumps(error_data, indent=2))
+            print_json(error_data)
         else:
             print_error(f"✗ Unexpected error: {e}")
             click.echo("\nPlease check:")
             click.echo("  1. ~/.env file exists and contains KUBERA_API_KEY and KUBERA_SECRET")
             click.echo("  2. The credentials are valid")
         sys.exit(1)
-    finally:
-        client.close()
 
 
 @cli.command()
@@ -408,6 +492,8 @@ def interactive(ctx: click.Context) -> None:
     Examples:
         kubera interactive
     """
+    from kubera.formatters import print_asset_tree, print_error, print_portfolio, print_portfolios
+
     client = get_client(ctx)
 
     try:
@@ -449,8 +535,6 @@ def interactive(ctx: click.Context) -> None:
         sys.exit(1)
     except KeyboardInterrupt:
         click.echo("\n\nGoodbye!")
-    finally:
-        client.close()
 
 
 if __name__ == "__main__":
@@ -1,21 +1,31 @@
 """Kubera API client implementation."""
 
+import email.utils
+import functools
 import os
-import re
-from typing import Any
+import time
+import weakref
+from typing import TYPE_CHECKING, Any
 
 import httpx
 from dotenv import load_dotenv
 
-from kubera.auth import create_auth_headers
+from kubera._json import dumps, loads
+from kubera.auth import create_auth_headers, create_hmac_template
 from kubera.exceptions import (
     KuberaAPIError,
     KuberaAuthenticationError,
     KuberaRateLimitError,
     KuberaValidationError,
 )
+from kubera.ratelimit import TokenBucket
 from kubera.types import PortfolioData, PortfolioSummary, UpdateItemRequest
 
+if TYPE_CHECKING:
+    # Only needed at runtime inside a running loop, where asyncio is already
+    # imported; importing it eagerly would slow down sync-only CLI use
+    import asyncio
+
 
 def _load_env_with_export_support(env_path: str) -> None:
     """Load .env file that may contain 'export' statements.
@@ -42,22 +52,83 @@ def _load_env_with_export_support(env_path: str) -> None:
                     if not line or line.startswith("#"):
                         continue
 
-                    # Match: export KEY=value or KEY=value
-                    # Handle quoted and unquoted values
-                    match = re.match(
-                        r'^\s*(?:export\s+)?([A-Z_][A-Z0-9_]*)\s*=\s*["\']?([^"\'\n]*)["\']?\s*$',
-                        line,
-                    )
-                    if match:
-                        key, value = match.groups()
-                        # Only set if not already in environment
-                        if key in ("KUBERA_API_KEY", "KUBERA_SECRET") and not os.getenv(key):
-                            os.environ[key] = value
+                    # Accept export KEY=value or KEY=value, with quoted or unquoted values
+                    key, sep, value = line.removeprefix("export ").partition("=")
+                    if not sep:
+                        continue
+                    key = key.strip()
+                    # Only set if not already in environment
+                    if key in ("KUBERA_API_KEY", "KUBERA_SECRET") and not os.getenv(key):
+                        os.environ[key] = value.strip().strip("\"'")
+
+                    # Stop once both credentials are available
+                    if os.getenv("KUBERA_API_KEY") and os.getenv("KUBERA_SECRET"):
+                        break
         except Exception:
             # If manual parsing fails, just continue - standard dotenv may have worked
             pass
 
 
+# Exception class and message template for each error status code the API documents
+_ERRORS: dict[int, tuple[type[KuberaAPIError], str]] = {
+    401: (
+        KuberaAuthenticationError,
+        "Authentication failed: {message}. Check: 1) Credentials are correct, "
+        "2) IP address is allowed (some API keys have IP restrictions)",
+    ),
+    403: (
+        KuberaAPIError,
+        "Permission denied: {message}. Note: Update operations require an API key with "
+        "update permissions enabled. Read-only API keys cannot modify data.",
+    ),
+    429: (
+        KuberaRateLimitError,
+        "Rate limit exceeded: {message}. "
+        "Limits: 30 req/min, 100/day (Essential) or 1000/day (Black)",
+    ),
+    400: (KuberaValidationError, "Validation error: {message}"),
+}
+_DEFAULT_ERROR: tuple[type[KuberaAPIError], str] = (
+    KuberaAPIError,
+    "API error ({status}): {message}",
+)
+
+
+@functools.lru_cache(maxsize=1)
+def _load_user_env() -> None:
+    """Load credentials from ~/.env at most once per process.
+
+    Values loaded from the file stay in os.environ, so later clients find them
+    there without touching the filesystem again.
+    """
+    _load_env_with_export_support(os.path.expanduser("~/.env"))
+
+
+def _retry_after_seconds(response: httpx.Response) -> float | None:
+    """Return the delay requested by a Retry-After header.
+
+    Args:
+        response: The rate-limited response
+
+    Returns:
+        Seconds to wait, or None if the header is absent or unparseable
+    """
+    value = response.headers.get("Retry-After")
+    if value is None:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+
+    # The header may also be an HTTP date
+    try:
+        retry_at = email.utils.parsedate_to_datetime(value).timestamp()
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, retry_at - time.time())
+
+
 class KuberaClient:
     """Modern async/sync client for Kubera Data API v3.
 
@@ -72,6 +143,13 @@ class KuberaClient:
 
     BASE_URL = "https://api.kubera.com"
     API_VERSION = "v3"
+    # Connection pool bounds shared by every request made through one client.
+    # Idle connections are kept for 30s so bursts of calls skip new TCP/TLS handshakes.
+    HTTP_LIMITS = httpx.Limits(
+        max_connections=20, max_keepalive_connections=10, keepalive_expiry=30.0
+    )
+
+    RATE_LIMIT_PER_MINUTE = 30
 
     def __init__(
         self,
@@ -79,6 +157,7 @@ class KuberaClient:
         secret: str | None = None,
         base_url: str | None = None,
         timeout: float = 30.0,
+        rate_limit: int | None = RATE_LIMIT_PER_MINUTE,
     ) -> None:
         """Initialize the Kubera client.
 
@@ -87,6 +166,8 @@ class KuberaClient:
             secret: Kubera API secret (defaults to KUBERA_SECRET env var)
             base_url: Base URL for API (defaults to https://api.kubera.com)
             timeout: Request timeout in seconds
+            rate_limit: Maximum requests per minute sent by this client, or None to
+                disable client-side rate limiting
 
         Raises:
             KuberaAuthenticationError: If credentials are not provided
@@ -97,21 +178,35 @@ class KuberaClient:
 
         # If not found in environment, try loading from ~/.env file
         # This handles both standard format (KEY=value) and shell format (export KEY=value)
-        if not self.api_key or not self.secret:
-            _load_env_with_export_support(os.path.expanduser("~/.env"))
+        if not (self.api_key and self.secret):
+            _load_user_env()
             self.api_key = self.api_key or os.getenv("KUBERA_API_KEY")
             self.secret = self.secret or os.getenv("KUBERA_SECRET")
-
-        if not self.api_key or not self.secret:
-            raise KuberaAuthenticationError(
-                "API credentials not found. Please provide api_key and secret, "
-                "or set KUBERA_API_KEY and KUBERA_SECRET environment variables."
-            )
+            if not (self.api_key and self.secret):
+                raise KuberaAuthenticationError(
+                    "API credentials not found. Please provide api_key and secret, "
+                    "or set KUBERA_API_KEY and KUBERA_SECRET environment variables."
+                )
 
         self.base_url = base_url or self.BASE_URL
         self.timeout = timeout
-        self._client = httpx.Client(timeout=timeout)
-        self._async_client: httpx.AsyncClient | None = None
+        self._hmac_template = create_hmac_template(self.secret)
+        self._api_prefix = f"/api/{self.API_VERSION}/data"
+        self._static_headers = {"Content-Type": "application/json"}
+        self._client = httpx.Client(
+            base_url=self.base_url, timeout=timeout, limits=self.HTTP_LIMITS, http2=True
+        )
+        # Return pooled sockets if the client is dropped or the interpreter exits
+        # without close(); the callback holds the httpx client, not self
+        self._finalizer = weakref.finalize(self, self._client.close)
+        # Stay under the per-minute API limit locally instead of paying for 429s;
+        # daily quotas depend on the account tier and are left to the server
+        self._rate_limiter = TokenBucket(rate_limit) if rate_limit else None
+        # One async client per event loop: pooled connections are bound to the loop
+        # that opened them, and entries disappear with their loop
+        self._async_clients: weakref.WeakKeyDictionary[
+            asyncio.AbstractEventLoop, httpx.AsyncClient
+        ] = weakref.WeakKeyDictionary()
 
     def __enter__(self) -> "KuberaClient":
         """Context manager entry."""
@@ -123,6 +218,8 @@ class KuberaClient:
 
     async def __aenter__(self) -> "KuberaClient":
         """Async context manager entry."""
+        # Open the pooled async client up front so concurrent tasks share it
+        self._get_async_client()
         return self
 
     async def __aexit__(self, *args: Any) -> None:
@@ -131,37 +228,68 @@ class KuberaClient:
 
     def close(self) -> None:
         """Close the synchronous HTTP client."""
-        self._client.close()
+        self._finalizer()
 
     async def aclose(self) -> None:
-        """Close the asynchronous HTTP client."""
-        if self._async_client:
-            await self._async_client.aclose()
+        """Close the asynchronous HTTP clients opened on every event loop.
+
+        A client bound to another running loop is closed on that loop; clients
+        left over from loops that are no longer running are closed best-effort.
+        """
+        import asyncio
+
+        current = asyncio.get_running_loop()
+        clients = list(self._async_clients.items())
+        self._async_clients.clear()
+        for loop, client in clients:
+            if loop is current:
+                await client.aclose()
+            elif loop.is_running():
+                # Pooled connections must be closed by the loop that opened them
+                await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(client.aclose(), loop))
+            else:
+                try:
+                    await client.aclose()
+                except RuntimeError:
+                    # Sockets of a closed loop can't be shut down from this one
+                    pass
 
     def _get_async_client(self) -> httpx.AsyncClient:
-        """Get or create async client."""
-        if self._async_client is None:
-            self._async_client = httpx.AsyncClient(timeout=self.timeout)
-        return self._async_client
-
-    def _build_url(self, path: str) -> str:
-        """Build full URL from path."""
-        return f"{self.base_url}{path}"
-
-    def _create_headers(
-        self, method: str, path: str, body: dict[str, Any] | None = None
-    ) -> dict[str, str]:
+        """Get or create the async client for the running event loop."""
+        import asyncio
+
+        loop = asyncio.get_running_loop()
+        client = self._async_clients.get(loop)
+        if client is None:
+            # HTTP/2 lets concurrent requests multiplex over one connection
+            client = httpx.AsyncClient(
+                base_url=self.base_url,
+                timeout=self.timeout,
+                limits=self.HTTP_LIMITS,
+                http2=True,
+            )
+            self._async_clients[loop] = client
+        return client
+
+    def _create_headers(self, method: str, path: str, body: bytes | None = None) -> dict[str, str]:
         """Create request headers with authentication."""
         # Type assertion safe because __init__ validates these are not None
         assert self.api_key is not None and self.secret is not None
-        headers = create_auth_headers(self.api_key, self.secret, method, path, body)
-        headers["Content-Type"] = "application/json"
-        return headers
+        return {
+            **create_auth_headers(
+                self.api_key, self.secret, method, path, body, hmac_template=self._hmac_template
+            ),
+            **self._static_headers,
+        }
 
     def _handle_response(self, response: httpx.Response) -> Any:
         """Handle API response and raise appropriate exceptions."""
-        if response.status_code == 200:
-            data = response.json()
+        status = response.status_code
+        if 200 <= status < 300:
+            # e.g. 204 No Content
+            if not response.content:
+                return None
+            data = loads(response.content)
             # Kubera API wraps responses in {"data": ..., "errorCode": 0}
             # Extract the data field if present
             if isinstance(data, dict) and "data" in data:
@@ -170,37 +298,58 @@ class KuberaClient:
 
         # Handle error responses
         try:
-            error_data = response.json()
+            error_data = loads(response.content)
             error_message = error_data.get("message", response.text)
         except Exception:
             error_message = response.text
 
-        if response.status_code == 401:
-            hint = (
-                " Check: 1) Credentials are correct, "
-                "2) IP address is allowed (some API keys have IP restrictions)"
-            )
-            raise KuberaAuthenticationError(
-                f"Authentication failed: {error_message}.{hint}", response.status_code
-            )
-        elif response.status_code == 403:
-            hint = (
-                " Note: Update operations require an API key with update permissions enabled. "
-                "Read-only API keys cannot modify data."
-            )
-            raise KuberaAPIError(f"Permission denied: {error_message}.{hint}", response.status_code)
-        elif response.status_code == 429:
-            raise KuberaRateLimitError(
-                f"Rate limit exceeded: {error_message}. "
-                "Limits: 30 req/min, 100/day (Essential) or 1000/day (Black)",
-                response.status_code,
-            )
-        elif response.status_code == 400:
-            raise KuberaValidationError(f"Validation error: {error_message}", response.status_code)
-        else:
-            raise KuberaAPIError(
-                f"API error ({response.status_code}): {error_message}", response.status_code
-            )
+        exc_class, template = _ERRORS.get(status, _DEFAULT_ERROR)
+        message = template.format(status=status, message=error_message)
+        if status == 429:
+            retry_after = _retry_after_seconds(response)
+            if self._rate_limiter is not None:
+                self._rate_limiter.pause(retry_after or 0.0)
+            raise KuberaRateLimitError(message, status, retry_after=retry_after)
+        raise exc_class(message, status)
+
+    def _request(self, method: str, endpoint: str, body: bytes | None = None) -> Any:
+        """Send a signed request on the pooled sync client.
+
+        Args:
+            method: HTTP method
+            endpoint: Path below the data API prefix, e.g. /portfolio
+            body: Compact JSON request body, exactly as signed
+
+        Returns:
+            Decoded response data
+        """
+        if self._rate_limiter is not None:
+            self._rate_limiter.acquire()
+        path = self._api_prefix + endpoint
+        headers = self._create_headers(method, path, body)
+
+        response = self._client.request(method, path, headers=headers, content=body)
+        return self._handle_response(response)
+
+    async def _arequest(self, method: str, endpoint: str, body: bytes | None = None) -> Any:
+        """Async: Send a signed request on this event loop's pooled client.
+
+        Args:
+            method: HTTP method
+            endpoint: Path below the data API prefix, e.g. /portfolio
+            body: Compact JSON request body, exactly as signed
+
+        Returns:
+            Decoded response data
+        """
+        if self._rate_limiter is not None:
+            await self._rate_limiter.aacquire()
+        path = self._api_prefix + endpoint
+        headers = self._create_headers(method, path, body)
+
+        client = self._get_async_client()
+        response = await client.request(method, path, headers=headers, content=body)
+        return self._handle_response(response)
 
     # Synchronous methods
 
@@ -213,11 +362,7 @@ class KuberaClient:
         Raises:
             KuberaAPIError: If the API request fails
         """
-        path = f"/api/{self.API_VERSION}/data/portfolio"
-        headers = self._create_headers("GET", path)
-
-        response = self._client.get(self._build_url(path), headers=headers)
-        return self._handle_response(response)
+        return self._request("GET", "/portfolio")
 
     def get_portfolio(self, portfolio_id: str) -> PortfolioData:
         """Get comprehensive data for a specific portfolio.
@@ -231,11 +376,7 @@ class KuberaClient:
         Raises:
             KuberaAPIError: If the API request fails
         """
-        path = f"/api/{self.API_VERSION}/data/portfolio/{portfolio_id}"
-        headers = self._create_headers("GET", path)
-
-        response = self._client.get(self._build_url(path), headers=headers)
-        return self._handle_response(response)
+        return self._request("GET", f"/portfolio/{portfolio_id}")
 
     def update_item(self, item_id: str, updates: UpdateItemRequest) -> dict[str, Any]:
         """Update an asset or debt item.
@@ -251,13 +392,7 @@ class KuberaClient:
             KuberaAPIError: If the API request fails
             KuberaValidationError: If the update data is invalid
         """
-        path = f"/api/{self.API_VERSION}/data/item/{item_id}"
-        # Cast UpdateItemRequest to dict for headers
-        body_dict: dict[str, Any] = dict(updates)
-        headers = self._create_headers("POST", path, body_dict)
-
-        response = self._client.post(self._build_url(path), headers=headers, json=updates)
-        return self._handle_response(response)
+        return self._request("POST", f"/item/{item_id}", dumps(updates))
 
     # Asynchronous methods
 
@@ -270,12 +405,7 @@ class KuberaClient:
         Raises:
             KuberaAPIError: If the API request fails
         """
-        path = f"/api/{self.API_VERSION}/data/portfolio"
-        headers = self._create_headers("GET", path)
-
-        client = self._get_async_client()
-        response = await client.get(self._build_url(path), headers=headers)
-        return self._handle_response(response)
+        return await self._arequest("GET", "/portfolio")
 
     async def aget_portfolio(self, portfolio_id: str) -> PortfolioData:
         """Async: Get comprehensive data for a specific portfolio.
@@ -289,12 +419,34 @@ class KuberaClient:
         Raises:
             KuberaAPIError: If the API request fails
         """
-        path = f"/api/{self.API_VERSION}/data/portfolio/{portfolio_id}"
-        headers = self._create_headers("GET", path)
+        return await self._arequest("GET", f"/portfolio/{portfolio_id}")
 
-        client = self._get_async_client()
-        response = await client.get(self._build_url(path), headers=headers)
-        return self._handle_response(response)
+    async def aget_all_portfolios(self, concurrency: int = 5) -> list[PortfolioData]:
+        """Async: Get comprehensive data for every portfolio.
+
+        Portfolio details are fetched concurrently over the shared connection pool,
+        with at most ``concurrency`` requests in flight, still paced by the client's
+        rate limiter.
+
+        Args:
+            concurrency: Maximum number of detail requests in flight at once
+
+        Returns:
+            Complete portfolio data for each portfolio, in list order
+
+        Raises:
+            KuberaAPIError: If any API request fails
+        """
+        import asyncio
+
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def fetch(portfolio_id: str) -> PortfolioData:
+            async with semaphore:
+                return await self.aget_portfolio(portfolio_id)
+
+        summaries = await self.aget_portfolios()
+        return list(await asyncio.gather(*(fetch(s["id"]) for s in summaries)))
 
     async def aupdate_item(self, item_id: str, updates: UpdateItemRequest) -> dict[str, Any]:
         """Async: Update an asset or debt item.
@@ -310,11 +462,4 @@ class KuberaClient:
             KuberaAPIError: If the API request fails
             KuberaValidationError: If the update data is invalid
         """
-        path = f"/api/{self.API_VERSION}/data/item/{item_id}"
-        # Cast UpdateItemRequest to dict for headers
-        body_dict: dict[str, Any] = dict(updates)
-        headers = self._create_headers("POST", path, body_dict)
-
-        client = self._get_async_client()
-        response = await client.post(self._build_url(path), headers=headers, json=updates)
-        return self._handle_response(response)
+        return await self._arequest("POST", f"/item/{item_id}", dumps(updates))
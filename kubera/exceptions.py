@@ -19,16 +19,28 @@ class KuberaAPIError(Exception):
 class KuberaAuthenticationError(KuberaAPIError):
     """Raised when authentication fails."""
 
-    pass
-
 
 class KuberaRateLimitError(KuberaAPIError):
-    """Raised when rate limit is exceeded."""
+    """Raised when rate limit is exceeded.
 
-    pass
+    Attributes:
+        retry_after: Seconds the server asked the client to wait before retrying,
+            from the Retry-After header, or None if the server did not say
+    """
+
+    def __init__(
+        self, message: str, status_code: int | None = None, retry_after: float | None = None
+    ) -> None:
+        """Initialize the exception.
+
+        Args:
+            message: Error message
+            status_code: HTTP status code if applicable
+            retry_after: Seconds to wait before retrying, if known
+        """
+        self.retry_after = retry_after
+        super().__init__(message, status_code)
 
 
 class KuberaValidationError(KuberaAPIError):
     """Raised when request validation fails."""
-
-    pass
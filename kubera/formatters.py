@@ -1,12 +1,74 @@
 """Output formatters for CLI."""
 
+import functools
 import json
-from typing import Any
+import math
+import sys
+from collections import defaultdict
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import Any, ParamSpec, TypeVar
 
 from rich.console import Console
 from rich.table import Table
+from rich.text import Span, Text
 from rich.tree import Tree
 
+from kubera._json import orjson
+
+# Shared by every formatter; the terminal is probed once, and output still goes to
+# whatever sys.stdout is at print time
+_CONSOLE = Console()
+
+_P = ParamSpec("_P")
+_R = TypeVar("_R")
+
+
+def _buffered(func: Callable[_P, _R]) -> Callable[_P, _R]:
+    """Collect a formatter's console output and write it in one go when it returns.
+
+    Args:
+        func: Formatter that prints to _CONSOLE several times
+
+    Returns:
+        Wrapped formatter
+    """
+
+    @functools.wraps(func)
+    def wrapper(*args: _P.args, **kwargs: _P.kwargs) -> _R:
+        with _CONSOLE:
+            return func(*args, **kwargs)
+
+    return wrapper
+
+
+def print_json(data: Any) -> None:
+    """Write data to stdout as indented JSON without building it as a str.
+
+    orjson's bytes go straight to the binary stream when stdout has one; text-only
+    streams (redirect_stdout to a StringIO, notebooks) get the decoded text. Without
+    orjson the stdlib encoder streams the same text to the text stream as it goes.
+
+    Args:
+        data: JSON-serializable data
+    """
+    if orjson is not None:
+        encoded = orjson.dumps(
+            data,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE,
+        )
+        buffer = getattr(sys.stdout, "buffer", None)
+        if buffer is None:
+            sys.stdout.write(encoded.decode())
+        else:
+            sys.stdout.flush()
+            buffer.write(encoded)
+            buffer.flush()
+    else:
+        # ensure_ascii=False writes non-ASCII as-is, matching orjson's UTF-8 output
+        json.dump(data, sys.stdout, indent=2, ensure_ascii=False)
+        sys.stdout.write("\n")
+
 
 def format_currency(amount: float | None, currency: str) -> str:
     """Format a currency value for display.
@@ -46,6 +108,88 @@ def format_number(value: float | int | str) -> str:
     return f"{value:,}"
 
 
+def _group_by_sheet(
+    items: list[dict[str, Any]],
+) -> tuple[dict[str, list[dict[str, Any]]], dict[str, float]]:
+    """Group items by sheet and total their values in one pass.
+
+    Parent accounts are grouped but left out of the totals, since their value
+    is already the sum of their children.
+
+    Args:
+        items: List of asset, debt, or insurance dictionaries
+
+    Returns:
+        Tuple of (items by sheet name, total value by sheet name), in first-seen order
+    """
+    parent_ids = {item.get("parent", {}).get("id") for item in items if "parent" in item}
+    groups: defaultdict[str, list[dict[str, Any]]] = defaultdict(list)
+    amounts: defaultdict[str, list[float]] = defaultdict(list)
+    sheet = None
+    for item in items:
+        # The API returns items grouped by sheet, so only look the sheet's lists
+        # up again when the sheet changes
+        if (key := item.get("sheetName", "Other")) != sheet:
+            sheet = key
+            sheet_items = groups[sheet]
+            sheet_amounts = amounts[sheet]
+        sheet_items.append(item)
+        if item.get("id") not in parent_ids:
+            sheet_amounts.append((item.get("value") or {}).get("amount") or 0)
+    totals = {name: math.fsum(values) for name, values in amounts.items()}
+    return groups, totals
+
+
+def _sheet_table(
+    groups: dict[str, list[dict[str, Any]]],
+    totals: dict[str, float],
+    value_style: str,
+    color_values: bool = False,
+) -> Table:
+    """Build a per-sheet summary table with item counts and totals.
+
+    Args:
+        groups: Items by sheet name, as returned by _group_by_sheet
+        totals: Total value by sheet name, as returned by _group_by_sheet
+        value_style: Style for the Total Value column
+        color_values: If True, also wrap each total in value_style markup
+
+    Returns:
+        Table with one row per sheet
+    """
+    table = Table(show_header=True, show_lines=False)
+    table.add_column("Sheet", style="cyan")
+    table.add_column("Items", justify="right")
+    table.add_column("Total Value", style=value_style, justify="right")
+
+    for sheet_name, items in groups.items():
+        currency = items[0].get("value", {}).get("currency", "USD")
+        total = format_currency(totals[sheet_name], currency)
+        if color_values:
+            total = f"[{value_style}]{total}[/{value_style}]"
+        table.add_row(sheet_name, str(len(items)), total)
+
+    return table
+
+
+def _add_item_nodes(branch: Tree, items: list[dict[str, Any]], limit: int = 10) -> None:
+    """Add "name: value" leaves for the first items to a tree branch.
+
+    Args:
+        branch: Tree branch to add to
+        items: Item dictionaries to show
+        limit: Maximum number of items before summarizing the rest
+    """
+    for item in items[:limit]:
+        value = item.get("value", {})
+        name = item.get("name", "Unknown")
+        amount = format_currency(value.get("amount"), value.get("currency", "USD"))
+        branch.add(f"{name}: {amount}")
+    if len(items) > limit:
+        branch.add(f"[dim]... {len(items) - limit} more[/dim]")
+
+
+@_buffered
 def print_portfolios(portfolios: list[dict[str, Any]], raw: bool = False) -> None:
     """Print portfolio list in human-readable or raw format.
 
@@ -54,10 +198,10 @@ def print_portfolios(portfolios: list[dict[str, Any]], raw: bool = False) -> Non
         raw: If True, output raw JSON
     """
     if raw:
-        print(json.dumps(portfolios, indent=2))
+        print_json(portfolios)
         return
 
-    console = Console()
+    console = _CONSOLE
 
     if not portfolios:
         console.print("[yellow]No portfolios found.[/yellow]")
@@ -83,6 +227,7 @@ def print_portfolios(portfolios: list[dict[str, Any]], raw: bool = False) -> Non
     )
 
 
+@_buffered
 def print_portfolio(portfolio: dict[str, Any], raw: bool = False) -> None:
     """Print detailed portfolio information.
 
@@ -94,10 +239,10 @@ def print_portfolio(portfolio: dict[str, Any], raw: bool = False) -> None:
         raw: If True, output raw JSON
     """
     if raw:
-        print(json.dumps(portfolio, indent=2))
+        print_json(portfolio)
         return
 
-    console = Console()
+    console = _CONSOLE
 
     # Header
     console.print(f"\n[bold cyan]{portfolio.get('name', 'Portfolio')}[/bold cyan]")
@@ -121,37 +266,9 @@ def print_portfolio(portfolio: dict[str, Any], raw: bool = False) -> None:
         )
         console.print(f"\n[bold]Assets ({len(assets)} items){total_str}[/bold]")
 
-        # Filter out parent accounts to avoid double-counting
-        parent_ids = {asset.get("parent", {}).get("id") for asset in assets if "parent" in asset}
-
-        # Group by sheet
-        by_sheet: dict[str, tuple[list[Any], float]] = {}
-        for asset in assets:
-            sheet = asset.get("sheetName", "Other")
-            value = asset.get("value", {})
-            amount = value.get("amount", 0) or 0
-
-            if sheet not in by_sheet:
-                by_sheet[sheet] = ([], 0)
-            items, total = by_sheet[sheet]
-            items.append(asset)
-            # Only add to total if this is not a parent account
-            if asset.get("id") not in parent_ids:
-                by_sheet[sheet] = (items, total + amount)
-            else:
-                by_sheet[sheet] = (items, total)
-
-        # Display sheets with totals
-        sheet_table = Table(show_header=True, show_lines=False)
-        sheet_table.add_column("Sheet", style="cyan")
-        sheet_table.add_column("Items", justify="right")
-        sheet_table.add_column("Total Value", style="green", justify="right")
-
-        for sheet_name, (items, total) in by_sheet.items():
-            currency = items[0].get("value", {}).get("currency", "USD") if items else "USD"
-            sheet_table.add_row(sheet_name, str(len(items)), format_currency(total, currency))
-
-        console.print(sheet_table)
+        # Group by sheet (parent accounts excluded from totals)
+        by_sheet, sheet_totals = _group_by_sheet(assets)
+        console.print(_sheet_table(by_sheet, sheet_totals, "green"))
 
     # Debts - API uses 'debt' not 'debts'
     debts = portfolio.get("debt", portfolio.get("debts", []))
@@ -164,85 +281,21 @@ def print_portfolio(portfolio: dict[str, Any], raw: bool = False) -> None:
         )
         console.print(f"\n[bold]Debts ({len(debts)} items){total_str}[/bold]")
 
-        # Filter out parent accounts to avoid double-counting
-        debt_parent_ids = {debt.get("parent", {}).get("id") for debt in debts if "parent" in debt}
-
-        # Group by sheet
-        by_sheet_debt: dict[str, tuple[list[Any], float]] = {}
-        for debt in debts:
-            sheet = debt.get("sheetName", "Other")
-            value = debt.get("value", {})
-            amount = value.get("amount", 0) or 0
-
-            if sheet not in by_sheet_debt:
-                by_sheet_debt[sheet] = ([], 0)
-            items, total = by_sheet_debt[sheet]
-            items.append(debt)
-            # Only add to total if this is not a parent account
-            if debt.get("id") not in debt_parent_ids:
-                by_sheet_debt[sheet] = (items, total + amount)
-            else:
-                by_sheet_debt[sheet] = (items, total)
-
-        # Display sheets with totals
-        debt_sheet_table = Table(show_header=True, show_lines=False)
-        debt_sheet_table.add_column("Sheet", style="cyan")
-        debt_sheet_table.add_column("Items", justify="right")
-        debt_sheet_table.add_column("Total Value", style="red", justify="right")
-
-        for sheet_name, (items, total) in by_sheet_debt.items():
-            currency = items[0].get("value", {}).get("currency", "USD") if items else "USD"
-            debt_sheet_table.add_row(
-                sheet_name, str(len(items)), f"[red]{format_currency(total, currency)}[/red]"
-            )
-
-        console.print(debt_sheet_table)
+        # Group by sheet (parent accounts excluded from totals)
+        by_sheet_debt, debt_totals = _group_by_sheet(debts)
+        console.print(_sheet_table(by_sheet_debt, debt_totals, "red", color_values=True))
 
     # Insurance
     insurance = portfolio.get("insurance", [])
     if insurance:
-        # Filter out parent accounts to avoid double-counting
-        ins_parent_ids = {ins.get("parent", {}).get("id") for ins in insurance if "parent" in ins}
-
-        # Calculate total
-        ins_total = sum(
-            ins.get("value", {}).get("amount", 0) or 0
-            for ins in insurance
-            if ins.get("id") not in ins_parent_ids
-        )
+        # Group by sheet if available (parent accounts excluded from totals)
+        by_sheet_ins, ins_totals = _group_by_sheet(insurance)
+        ins_total = math.fsum(ins_totals.values())
         total_str = f" - Total: {format_currency(ins_total, 'USD')}" if ins_total else ""
         console.print(f"\n[bold]Insurance ({len(insurance)} items){total_str}[/bold]")
 
-        # Group by sheet if available
-        by_sheet_ins: dict[str, tuple[list[Any], float]] = {}
-        for ins in insurance:
-            sheet = ins.get("sheetName", "Other")
-            value = ins.get("value", {})
-            amount = value.get("amount", 0) or 0
-
-            if sheet not in by_sheet_ins:
-                by_sheet_ins[sheet] = ([], 0)
-            items, total = by_sheet_ins[sheet]
-            items.append(ins)
-            # Only add to total if this is not a parent account
-            if ins.get("id") not in ins_parent_ids:
-                by_sheet_ins[sheet] = (items, total + amount)
-            else:
-                by_sheet_ins[sheet] = (items, total)
-
         if len(by_sheet_ins) > 1:  # Only show sheets if there's more than one
-            ins_sheet_table = Table(show_header=True, show_lines=False)
-            ins_sheet_table.add_column("Sheet", style="cyan")
-            ins_sheet_table.add_column("Items", justify="right")
-            ins_sheet_table.add_column("Total Value", style="blue", justify="right")
-
-            for sheet_name, (items, total) in by_sheet_ins.items():
-                currency = items[0].get("value", {}).get("currency", "USD") if items else "USD"
-                ins_sheet_table.add_row(
-                    sheet_name, str(len(items)), format_currency(total, currency)
-                )
-
-            console.print(ins_sheet_table)
+            console.print(_sheet_table(by_sheet_ins, ins_totals, "blue"))
 
     # Documents - API uses 'document' not 'documents'
     documents = portfolio.get("document", portfolio.get("documents", []))
@@ -258,7 +311,7 @@ def print_asset_tree(portfolio: dict[str, Any]) -> None:
     Args:
         portfolio: Portfolio dictionary
     """
-    console = Console()
+    console = _CONSOLE
 
     # Header with net worth
     net_worth_amount = portfolio.get("netWorth")
@@ -279,22 +332,11 @@ def print_asset_tree(portfolio: dict[str, Any]) -> None:
         asset_branch = tree.add(f"[cyan]Assets ({len(assets)}){total_str}[/cyan]")
 
         # Group by sheet/type for better organization
-        by_sheet: dict[str, list[Any]] = {}
-        for asset in assets:
-            sheet = asset.get("sheetName", "Other")
-            if sheet not in by_sheet:
-                by_sheet[sheet] = []
-            by_sheet[sheet].append(asset)
+        by_sheet, _ = _group_by_sheet(assets)
 
         for sheet_name, sheet_assets in list(by_sheet.items())[:5]:  # Show first 5 sheets
             sheet_branch = asset_branch.add(f"[yellow]{sheet_name}[/yellow]")
-            for asset in sheet_assets[:10]:  # Show first 10 per sheet
-                value = asset.get("value", {})
-                name = asset.get("name", "Unknown")
-                amount = format_currency(value.get("amount"), value.get("currency", "USD"))
-                sheet_branch.add(f"{name}: {amount}")
-            if len(sheet_assets) > 10:
-                sheet_branch.add(f"[dim]... {len(sheet_assets) - 10} more[/dim]")
+            _add_item_nodes(sheet_branch, sheet_assets)  # Show first 10 per sheet
 
         if len(by_sheet) > 5:
             asset_branch.add(f"[dim]... {len(by_sheet) - 5} more categories[/dim]")
@@ -308,29 +350,18 @@ def print_asset_tree(portfolio: dict[str, Any]) -> None:
             total_str = f" - Total: {format_currency(debt_total, 'USD')}"
 
         debt_branch = tree.add(f"[red]Debts ({len(debts)}){total_str}[/red]")
-        for debt in debts[:10]:
-            value = debt.get("value", {})
-            name = debt.get("name", "Unknown")
-            amount = format_currency(value.get("amount"), value.get("currency", "USD"))
-            debt_branch.add(f"{name}: {amount}")
-        if len(debts) > 10:
-            debt_branch.add(f"[dim]... {len(debts) - 10} more[/dim]")
+        _add_item_nodes(debt_branch, debts)
 
     # Insurance
     insurance = portfolio.get("insurance", [])
     if insurance:
         ins_branch = tree.add(f"[blue]Insurance ({len(insurance)})[/blue]")
-        for ins in insurance[:10]:
-            value = ins.get("value", {})
-            name = ins.get("name", "Unknown")
-            amount = format_currency(value.get("amount"), value.get("currency", "USD"))
-            ins_branch.add(f"{name}: {amount}")
-        if len(insurance) > 10:
-            ins_branch.add(f"[dim]... {len(insurance) - 10} more[/dim]")
+        _add_item_nodes(ins_branch, insurance)
 
     console.print(tree)
 
 
+@_buffered
 def print_item(item: dict[str, Any], raw: bool = False) -> None:
     """Print item details.
 
@@ -339,10 +370,10 @@ def print_item(item: dict[str, Any], raw: bool = False) -> None:
         raw: If True, output raw JSON
     """
     if raw:
-        print(json.dumps(item, indent=2))
+        print_json(item)
         return
 
-    console = Console()
+    console = _CONSOLE
 
     console.print(f"\n[bold cyan]{item.get('name', 'Item')}[/bold cyan]")
     console.print(f"[dim]ID: {item.get('id', 'N/A')}[/dim]")
@@ -377,10 +408,49 @@ def print_success(message: str) -> None:
     Args:
         message: Success message
     """
-    console = Console()
+    console = _CONSOLE
     console.print(f"[green]✓[/green] {message}")
 
 
+# Style and sign for gain/loss cells
+_GAIN = ("green", "+")
+_LOSS = ("red", "")
+
+
+def _styled(text: str, style: str) -> Text:
+    """Color text the way ``[style]text[/style]`` markup would, without parsing it."""
+    # A span (unlike Text's base style) leaves the cell's justify padding unstyled
+    return Text(text, spans=[Span(0, len(text), style)])
+
+
+# Display fields pulled out of an item once: name, value amount, currency, ticker,
+# quantity, and cost amount (None when the item has no cost basis)
+_Row = tuple[str, float, str, Any, Any, float | None]
+
+
+@dataclass(slots=True)
+class _SectionSummary:
+    """Rows, running totals, and column flags for one section of a sheet."""
+
+    rows: list[_Row] = field(default_factory=list)
+    values: list[float] = field(default_factory=list)
+    costs: list[float] = field(default_factory=list)
+    has_ticker: bool = False
+    has_quantity: bool = False
+    has_cost: bool = False
+
+    @property
+    def value(self) -> float:
+        """Total value of the section's items."""
+        return math.fsum(self.values)
+
+    @property
+    def cost(self) -> float:
+        """Total cost basis of the section's items that have one."""
+        return math.fsum(self.costs)
+
+
+@_buffered
 def print_sheet_detail(
     items: list[dict[str, Any]],
     sheet_name: str,
@@ -400,10 +470,10 @@ def print_sheet_detail(
         raw: If True, output raw JSON
     """
     if raw:
-        print(json.dumps(items, indent=2))
+        print_json(items)
         return
 
-    console = Console()
+    console = _CONSOLE
 
     # Header
     console.print(f"\n[bold cyan]{portfolio_name}[/bold cyan]")
@@ -411,15 +481,52 @@ def print_sheet_detail(
 
     # Filter out parent accounts to avoid double-counting in totals
     parent_ids = {item.get("parent", {}).get("id") for item in items if "parent" in item}
-    items_for_totals = [item for item in items if item.get("id") not in parent_ids]
 
-    # Calculate totals (excluding parent accounts)
-    total_value = sum(item.get("value", {}).get("amount", 0) or 0 for item in items_for_totals)
-    total_cost = sum(
-        item.get("cost", {}).get("amount", 0) or 0 for item in items_for_totals if "cost" in item
-    )
+    # Group by section and total values and costs in one pass (excluding parent accounts)
+    by_section: defaultdict[str, _SectionSummary] = defaultdict(_SectionSummary)
+    values: list[float] = []
+    costs: list[float] = []
+    current_section = None
+    for item in items:
+        if item.get("id") in parent_ids:
+            continue
+        # Items arrive grouped by section, so only look the summary up when it changes
+        if (key := item.get("sectionName", "Other")) != current_section:
+            current_section = key
+            section = by_section[current_section]
+
+        value = item.get("value", {})
+        value_amount = value.get("amount", 0) or 0
+        section.values.append(value_amount)
+        values.append(value_amount)
+        cost_amount = None
+        if "cost" in item:
+            cost_amount = item["cost"].get("amount", 0) or 0
+            section.costs.append(cost_amount)
+            costs.append(cost_amount)
+            if cost_amount:
+                section.has_cost = True
+        ticker = item.get("ticker", "")
+        if ticker:
+            section.has_ticker = True
+        quantity = item.get("quantity", "")
+        if quantity:
+            section.has_quantity = True
+
+        section.rows.append(
+            (
+                item.get("name", "N/A"),
+                value_amount,
+                value.get("currency", "USD"),
+                ticker,
+                quantity,
+                cost_amount,
+            )
+        )
 
     # Overall gains
+    total_value = math.fsum(values)
+    total_cost = math.fsum(costs)
     if total_cost > 0:
         total_gain = total_value - total_cost
         total_gain_pct = (total_gain / total_cost) * 100
@@ -435,28 +542,15 @@ def print_sheet_detail(
     else:
         console.print(f"\n[bold]Total Value:[/bold] {format_currency(total_value, 'USD')}")
 
-    # Group by section (excluding parent accounts)
-    by_section: dict[str, list[dict[str, Any]]] = {}
-    for item in items:
-        if item.get("id") not in parent_ids:  # Skip parent accounts
-            section = item.get("sectionName", "Other")
-            if section not in by_section:
-                by_section[section] = []
-            by_section[section].append(item)
-
-    console.print(
-        f"\n[dim]Total Items: {len(items_for_totals)} across {len(by_section)} section(s)[/dim]"
-    )
+    console.print(f"\n[dim]Total Items: {len(values)} across {len(by_section)} section(s)[/dim]")
 
     # Display each section
-    for section_name, section_items in by_section.items():
-        # Section header with totals (items already filtered, no parents)
-        section_value = sum(item.get("value", {}).get("amount", 0) or 0 for item in section_items)
-        section_cost = sum(
-            item.get("cost", {}).get("amount", 0) or 0 for item in section_items if "cost" in item
-        )
+    for section_name, summary in by_section.items():
+        section_rows = summary.rows  # Already filtered, no parent accounts
+        section_value = summary.value
+        section_cost = summary.cost
 
-        console.print(f"\n[bold yellow]{section_name}[/bold yellow] ({len(section_items)} items)")
+        console.print(f"\n[bold yellow]{section_name}[/bold yellow] ({len(section_rows)} items)")
 
         if section_cost > 0:
             section_gain = section_value - section_cost
@@ -472,69 +566,50 @@ def print_sheet_detail(
         else:
             console.print(f"[dim]Value: {format_currency(section_value, 'USD')}[/dim]")
 
-        # Detect which columns have data in this section
-        has_ticker = any(item.get("ticker") for item in section_items)
-        has_quantity = any(item.get("quantity") for item in section_items)
-        has_cost = any(
-            "cost" in item and item.get("cost", {}).get("amount") for item in section_items
-        )
-
         # Create table for this section with only relevant columns
         table = Table(show_header=True, show_lines=False, box=None)
         table.add_column("Name", style="cyan")
         table.add_column("Value", style="green", justify="right")
-        if has_ticker:
+        if summary.has_ticker:
             table.add_column("Ticker", style="yellow")
-        if has_quantity:
+        if summary.has_quantity:
             table.add_column("Quantity", justify="right")
-        if has_cost:
+        if summary.has_cost:
             table.add_column("Cost Basis", justify="right")
             table.add_column("Gain/Loss", justify="right")
             table.add_column("Gain %", justify="right")
 
-        # section_items are already filtered (no parent accounts)
-        for item in section_items:
-            name = item.get("name", "N/A")
-            value = item.get("value", {})
-            value_amount = value.get("amount", 0) or 0
-            currency = value.get("currency", "USD")
-            ticker = item.get("ticker", "")
-            quantity = item.get("quantity", "")
-
-            # Build row dynamically based on which columns are present
-            row = [name, format_currency(value_amount, currency)]
+        for name, value_amount, currency, ticker, quantity, cost_amount in section_rows:
+            # Build row dynamically based on which columns are present. Cells are Text
+            # so Rich neither parses them for markup nor misreads bracketed names
+            row = [Text(name or "N/A"), Text(format_currency(value_amount, currency))]
 
-            if has_ticker:
-                row.append(ticker)
+            if summary.has_ticker:
+                row.append(Text(ticker or ""))
 
-            if has_quantity:
-                qty_str = format_number(quantity) if quantity else ""
-                row.append(qty_str)
+            if summary.has_quantity:
+                row.append(Text(format_number(quantity) if quantity else ""))
 
-            if has_cost:
+            if summary.has_cost:
                 # Cost basis and gains
                 cost_str = ""
-                gain_str = ""
-                gain_pct_str = ""
+                gain_cell = Text()
+                gain_pct_cell = Text()
 
-                if "cost" in item:
-                    cost = item["cost"]
-                    cost_amount = cost.get("amount", 0) or 0
+                if cost_amount is not None:
                     cost_str = format_currency(cost_amount, currency)
 
                     if cost_amount > 0:
                         gain = value_amount - cost_amount
                         gain_pct = (gain / cost_amount) * 100
-                        gain_color = "green" if gain >= 0 else "red"
-                        gain_sign = "+" if gain >= 0 else ""
+                        gain_style, gain_sign = _GAIN if gain >= 0 else _LOSS
 
-                        gain_str = (
-                            f"[{gain_color}]{gain_sign}"
-                            f"{format_currency(gain, currency)}[/{gain_color}]"
+                        gain_cell = _styled(
+                            f"{gain_sign}{format_currency(gain, currency)}", gain_style
                         )
-                        gain_pct_str = f"[{gain_color}]{gain_sign}{gain_pct:.2f}%[/{gain_color}]"
+                        gain_pct_cell = _styled(f"{gain_sign}{gain_pct:.2f}%", gain_style)
 
-                row.extend([cost_str, gain_str, gain_pct_str])
+                row.extend([Text(cost_str), gain_cell, gain_pct_cell])
 
             table.add_row(*row)
 
@@ -549,5 +624,5 @@ def print_error(message: str) -> None:
     Args:
         message: Error message
     """
-    console = Console()
+    console = _CONSOLE
     console.print(f"[red]✗[/red] {message}", style="red")
@@ -0,0 +1,94 @@
+"""Client-side rate limiting for Kubera API requests."""
+
+import threading
+import time
+
+
+class TokenBucket:
+    """Token bucket that spaces out requests to stay within a rate limit.
+
+    Each request reserves a token up front. When the bucket is empty the
+    reservation still succeeds, but the caller is told how long to wait for
+    its token to refill, so concurrent callers are released in arrival order.
+    """
+
+    def __init__(self, capacity: int, period: float = 60.0) -> None:
+        """Initialize the bucket full.
+
+        Args:
+            capacity: Maximum number of requests allowed per period
+            period: Length of the rate limit window in seconds
+        """
+        self.capacity = capacity
+        self.rate = capacity / period
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        # Bumped by pause() so callers already waiting know their slot was cancelled
+        self._generation = 0
+        self._lock = threading.Lock()
+
+    def _reserve(self) -> tuple[float, int]:
+        """Reserve a token and note which pause generation it belongs to.
+
+        Returns:
+            Tuple of (seconds to wait, pause generation at reservation time)
+        """
+        with self._lock:
+            now = time.monotonic()
+            # _updated is in the future while the bucket is paused; refill only
+            # once that moment has passed
+            if now > self._updated:
+                elapsed = now - self._updated
+                self._tokens = min(self.capacity, self._tokens + elapsed * self.rate)
+                self._updated = now
+            self._tokens -= 1
+            delay = max(0.0, self._updated - now) + max(0.0, -self._tokens) / self.rate
+            return delay, self._generation
+
+    def reserve(self) -> float:
+        """Reserve a token for one request.
+
+        Returns:
+            Seconds the caller must wait before sending the request
+        """
+        return self._reserve()[0]
+
+    def pause(self, delay: float = 0.0) -> None:
+        """Empty the bucket after the server reports the rate limit was hit.
+
+        Future requests are released one token at a time, the first one after
+        ``delay`` seconds, instead of retrying against the server all at once.
+        Requests already waiting in acquire/aacquire lose their slot: when they
+        wake they queue again behind the pause.
+
+        Args:
+            delay: Seconds to hold every request, e.g. from a Retry-After header
+        """
+        with self._lock:
+            # Waiting callers will reserve again, so drop their outstanding slots
+            self._tokens = 0.0
+            # Backdate the refill clock so exactly one token is ready at the deadline
+            self._updated = time.monotonic() + delay - 1 / self.rate
+            self._generation += 1
+
+    def acquire(self) -> None:
+        """Block until a request may be sent."""
+        delay, generation = self._reserve()
+        while delay > 0:
+            time.sleep(delay)
+            if self._generation == generation:
+                return
+            # Paused while sleeping; the old slot fell inside the Retry-After window
+            delay, generation = self._reserve()
+
+    async def aacquire(self) -> None:
+        """Async: Wait until a request may be sent."""
+        import asyncio
+
+        delay, generation = self._reserve()
+        while delay > 0:
+            await asyncio.sleep(delay)
+            if self._generation == generation:
+                return
+            # Paused while sleeping; the old slot fell inside the Retry-After window
+            delay, generation = self._reserve()
@@ -1,5 +1,9 @@
 """Test fixtures based on real API responses with sanitized data."""
 
+from dataclasses import dataclass, field
+
+import httpx
+
 # Portfolio list response (GET /api/v3/data/portfolio)
 PORTFOLIOS_LIST_RESPONSE = [
     {"id": "portfolio_001", "name": "Test Portfolio 1", "currency": "USD"},
@@ -199,3 +203,17 @@ ERROR_RESPONSE_400 = {"errorCode": 400, "message": "Invalid request data"}
 def wrap_api_response(data):
     """Wrap data in the standard Kubera API response format."""
     return {"data": data, "errorCode": 0}
+
+
+@dataclass(slots=True)
+class FakeResponse:
+    """Stand-in for httpx.Response exposing only what KuberaClient reads."""
+
+    status_code: int
+    content: bytes = b""
+    headers: httpx.Headers = field(default_factory=httpx.Headers)
+
+    @property
+    def text(self) -> str:
+        """Decode the body on access, like httpx.Response.text."""
+        return self.content.decode()
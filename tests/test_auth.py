@@ -1,8 +1,19 @@
 """Tests for authentication utilities."""
 
+import hashlib
+import hmac
 import time
+from unittest.mock import patch
 
-from kubera.auth import create_auth_headers, generate_signature
+from kubera.auth import create_auth_headers, create_hmac_template, generate_signature
+
+# Expected signatures for the fixed test_key/test_secret/1234567890 requests below
+_EXPECTED_GET_SIG = hmac.digest(
+    b"test_secret", b"test_key1234567890GET/api/v3/data/portfolio", "sha256"
+).hex()
+_EXPECTED_POST_SIG = hmac.digest(
+    b"test_secret", b'test_key1234567890POST/api/v3/data/item/123{"value":400}', "sha256"
+).hex()
 
 
 def test_generate_signature_get_request() -> None:
@@ -21,6 +32,7 @@ def test_generate_signature_get_request() -> None:
 
     assert isinstance(signature, str)
     assert len(signature) == 64  # SHA256 hex digest length
+    assert signature == _EXPECTED_GET_SIG
     assert returned_timestamp == timestamp
 
 
@@ -42,6 +54,7 @@ def test_generate_signature_post_request() -> None:
 
     assert isinstance(signature, str)
     assert len(signature) == 64
+    assert signature == _EXPECTED_POST_SIG
     assert returned_timestamp == timestamp
 
 
@@ -79,10 +92,10 @@ def test_signature_consistency() -> None:
     timestamp = "1234567890"
     path = "/api/v3/data/portfolio"
 
-    sig1, _ = generate_signature(api_key, secret, "GET", path, timestamp=timestamp)
-    sig2, _ = generate_signature(api_key, secret, "GET", path, timestamp=timestamp)
+    signature, _ = generate_signature(api_key, secret, "GET", path, timestamp=timestamp)
 
-    assert sig1 == sig2
+    # Matching a digest computed independently at import proves it is deterministic
+    assert signature == _EXPECTED_GET_SIG
 
 
 def test_signature_changes_with_body() -> None:
@@ -100,3 +113,73 @@ def test_signature_changes_with_body() -> None:
     )
 
     assert sig1 != sig2
+
+
+def test_signature_with_hmac_template_matches() -> None:
+    """Test that a cached HMAC template produces the same signature."""
+    api_key = "test_key"
+    secret = "test_secret"
+    timestamp = "1234567890"
+    path = "/api/v3/data/item/123"
+    template = create_hmac_template(secret)
+
+    sig1, _ = generate_signature(
+        api_key, secret, "POST", path, body={"value": 100}, timestamp=timestamp
+    )
+    sig2, _ = generate_signature(
+        api_key,
+        secret,
+        "POST",
+        path,
+        body={"value": 100},
+        timestamp=timestamp,
+        hmac_template=template,
+    )
+    # Template must be reusable without being mutated by previous signatures
+    sig3, _ = generate_signature(
+        api_key,
+        secret,
+        "POST",
+        path,
+        body={"value": 100},
+        timestamp=timestamp,
+        hmac_template=template,
+    )
+
+    assert sig1 == sig2 == sig3
+
+
+def test_signature_uses_compact_body() -> None:
+    """Test that the body is signed as compact JSON with non-ASCII preserved."""
+    api_key = "test_key"
+    secret = "test_secret"
+    timestamp = "1234567890"
+    path = "/api/v3/data/item/123"
+    body = {"name": "Café", "value": 400}
+
+    signature, _ = generate_signature(api_key, secret, "POST", path, body, timestamp)
+
+    data = f'{api_key}{timestamp}POST{path}{{"name":"Café","value":400}}'
+    expected = hmac.new(secret.encode("utf-8"), data.encode("utf-8"), hashlib.sha256).hexdigest()
+    assert signature == expected
+
+
+def test_signature_accepts_serialized_body() -> None:
+    """Test that a pre-serialized body signs the same as the equivalent dictionary."""
+    args = ("test_key", "test_secret", "POST", "/api/v3/data/item/123")
+    body = {"name": "Café", "value": 400}
+
+    from_dict, _ = generate_signature(*args, body, "1234567890")
+    from_bytes, _ = generate_signature(*args, '{"name":"Café","value":400}'.encode(), "1234567890")
+
+    assert from_bytes == from_dict
+
+
+def test_generate_signature_uses_one_shot_digest() -> None:
+    """Test that signing without a template never builds a Python HMAC object."""
+    with patch("kubera.auth.hmac.new", side_effect=AssertionError("hmac.new called")):
+        signature, _ = generate_signature(
+            "test_key", "test_secret", "GET", "/api/v3/data/portfolio", timestamp="1234567890"
+        )
+
+    assert signature == _EXPECTED_GET_SIG
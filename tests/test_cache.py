@@ -0,0 +1,201 @@
+"""Tests for portfolio cache management."""
+
+import json
+import os
+import time
+
+import pytest
+
+from kubera import cache
+from tests.fixtures import PORTFOLIO_DETAIL_RESPONSE, PORTFOLIOS_LIST_RESPONSE
+
+
+@pytest.fixture
+def cache_file(tmp_path, monkeypatch):
+    """Point the portfolio cache at a temporary file."""
+    path = tmp_path / "portfolio_cache.json"
+    monkeypatch.setattr(cache, "get_cache_file", lambda: path)
+    return path
+
+
+def test_load_missing_cache(cache_file) -> None:
+    """Test that a missing cache file yields an empty list."""
+    assert cache.load_portfolio_cache() == []
+
+
+def test_save_and_load_roundtrip(cache_file) -> None:
+    """Test that saved portfolios can be loaded back."""
+    cache.save_portfolio_cache(PORTFOLIOS_LIST_RESPONSE)
+
+    assert cache.load_portfolio_cache() == PORTFOLIOS_LIST_RESPONSE
+
+
+def test_save_cache_leaves_no_temp_file(cache_file) -> None:
+    """Test that saving replaces the cache atomically without leftovers."""
+    cache.save_portfolio_cache(PORTFOLIOS_LIST_RESPONSE)
+
+    assert [p.name for p in cache_file.parent.iterdir()] == [cache_file.name]
+
+
+def test_save_cache_is_private(cache_file) -> None:
+    """Test that the cache file is only readable by the current user."""
+    cache.save_portfolio_cache(PORTFOLIOS_LIST_RESPONSE)
+
+    assert cache_file.stat().st_mode & 0o777 == 0o600
+
+
+def test_failed_save_cleans_up_temp_file(cache_file, monkeypatch) -> None:
+    """Test that a write that fails before the rename leaves nothing behind."""
+
+    def fail_replace(src, dst):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(cache.os, "replace", fail_replace)
+
+    with pytest.raises(OSError):
+        cache.save_portfolio_cache(PORTFOLIOS_LIST_RESPONSE)
+
+    assert list(cache_file.parent.iterdir()) == []
+
+
+def test_load_cache_reloads_after_save_in_same_tick(cache_file) -> None:
+    """Test that a save is picked up even if the mtime didn't change."""
+    cache.save_portfolio_cache(PORTFOLIOS_LIST_RESPONSE)
+    assert len(cache.load_portfolio_cache()) == 3
+    before = cache_file.stat()
+
+    cache.save_portfolio_cache(PORTFOLIOS_LIST_RESPONSE[:1])
+    # Simulate both writes landing in the same mtime tick
+    os.utime(cache_file, ns=(before.st_atime_ns, before.st_mtime_ns))
+
+    assert cache.load_portfolio_cache() == PORTFOLIOS_LIST_RESPONSE[:1]
+
+
+def test_load_cache_reloads_after_external_rewrite(cache_file) -> None:
+    """Test that another process rewriting the file in the same tick is noticed."""
+    cache.save_portfolio_cache(PORTFOLIOS_LIST_RESPONSE)
+    assert len(cache.load_portfolio_cache()) == 3
+    before = cache_file.stat()
+
+    cache_file.write_text(json.dumps({"portfolios": PORTFOLIOS_LIST_RESPONSE[:1]}))
+    os.utime(cache_file, ns=(before.st_atime_ns, before.st_mtime_ns))
+
+    assert cache.load_portfolio_cache() == PORTFOLIOS_LIST_RESPONSE[:1]
+
+
+def test_load_cache_returns_copies(cache_file) -> None:
+    """Test that mutating loaded portfolios doesn't affect later loads."""
+    cache.save_portfolio_cache(PORTFOLIOS_LIST_RESPONSE)
+
+    portfolios = cache.load_portfolio_cache()
+    portfolios[0]["name"] = "Mutated"
+    portfolios.clear()
+
+    assert cache.load_portfolio_cache()[0]["name"] == "Test Portfolio 1"
+
+
+def test_load_corrupt_cache(cache_file) -> None:
+    """Test that an unreadable cache file yields an empty list."""
+    cache_file.write_text("{not json")
+
+    assert cache.load_portfolio_cache() == []
+
+
+def test_resolve_portfolio_id_by_index(cache_file) -> None:
+    """Test resolving a numeric index through the cache."""
+    cache_file.write_text(json.dumps({"portfolios": PORTFOLIOS_LIST_RESPONSE}))
+
+    assert cache.resolve_portfolio_id("2") == "portfolio_002"
+    assert cache.resolve_portfolio_id("4") is None
+    assert cache.resolve_portfolio_id("abc") is None
+
+
+def test_resolve_portfolio_id_batch_loads_cache_once(cache_file, monkeypatch) -> None:
+    """Test that batch resolution reads the cache a single time."""
+    cache.save_portfolio_cache(PORTFOLIOS_LIST_RESPONSE)
+    calls = []
+    load = cache.load_portfolio_cache
+    monkeypatch.setattr(cache, "load_portfolio_cache", lambda: calls.append(1) or load())
+    guid = "12345678-1234-1234-1234-123456789012"
+
+    resolved = cache.resolve_portfolio_id_batch(["1", guid, "3", "9", "x"])
+
+    assert resolved == ["portfolio_001", guid, "portfolio_003", None, None]
+    assert len(calls) == 1
+
+
+def test_resolve_portfolio_id_guid() -> None:
+    """Test that GUIDs are returned unchanged."""
+    guid = "12345678-1234-1234-1234-123456789012"
+
+    assert cache.resolve_portfolio_id(guid) == guid
+
+
+def test_resolve_portfolio_id_rejects_misplaced_hyphens(cache_file) -> None:
+    """Test that 36-char strings without GUID hyphen layout aren't treated as IDs."""
+    assert cache.resolve_portfolio_id("-" + "a" * 35) is None
+
+
+@pytest.fixture
+def cache_dir(tmp_path, monkeypatch):
+    """Point the portfolio detail cache at a temporary directory."""
+    monkeypatch.setattr(cache, "get_cache_dir", lambda: tmp_path)
+    return tmp_path
+
+
+def test_portfolio_detail_roundtrip(cache_dir) -> None:
+    """Test that a saved portfolio detail is loaded while fresh."""
+    cache.save_portfolio_detail("portfolio_001", PORTFOLIO_DETAIL_RESPONSE)
+
+    assert cache.load_portfolio_detail("portfolio_001") == PORTFOLIO_DETAIL_RESPONSE
+    assert (cache_dir / "details" / "portfolio_001.json").stat().st_mode & 0o777 == 0o600
+
+
+def test_portfolio_detail_expires(cache_dir) -> None:
+    """Test that a stale portfolio detail is ignored."""
+    cache.save_portfolio_detail("portfolio_001", PORTFOLIO_DETAIL_RESPONSE)
+    detail_file = cache_dir / "details" / "portfolio_001.json"
+    stale = time.time() - cache.DETAIL_MAX_AGE - 1
+    os.utime(detail_file, (stale, stale))
+
+    assert cache.load_portfolio_detail("portfolio_001") is None
+
+
+def test_portfolio_detail_rejects_unsafe_id(cache_dir) -> None:
+    """Test that IDs that aren't safe file names are never cached."""
+    cache.save_portfolio_detail("../escape", PORTFOLIO_DETAIL_RESPONSE)
+
+    assert list(cache_dir.iterdir()) == []
+    assert cache.load_portfolio_detail("../escape") is None
+
+
+def test_portfolio_detail_rejects_trailing_newline(cache_dir) -> None:
+    """Test that an otherwise safe ID with a trailing newline is never cached."""
+    cache.save_portfolio_detail("portfolio_001\n", PORTFOLIO_DETAIL_RESPONSE)
+
+    assert list(cache_dir.iterdir()) == []
+    assert cache.load_portfolio_detail("portfolio_001\n") is None
+
+
+def test_detail_cache_never_overwrites_index(cache_dir, monkeypatch) -> None:
+    """Test that a portfolio ID can't name a file that collides with the index."""
+    monkeypatch.setattr(cache, "get_cache_file", lambda: cache_dir / "portfolio_cache.json")
+    cache.save_portfolio_cache(PORTFOLIOS_LIST_RESPONSE)
+
+    cache.save_portfolio_detail("cache", PORTFOLIO_DETAIL_RESPONSE)
+
+    assert cache.load_portfolio_cache() == PORTFOLIOS_LIST_RESPONSE
+    assert cache.load_portfolio_detail("cache") == PORTFOLIO_DETAIL_RESPONSE
+
+
+def test_clear_portfolio_details_keeps_index(cache_dir, monkeypatch) -> None:
+    """Test that clearing detail responses leaves the portfolio index alone."""
+    index_file = cache_dir / "portfolio_cache.json"
+    monkeypatch.setattr(cache, "get_cache_file", lambda: index_file)
+    cache.save_portfolio_cache(PORTFOLIOS_LIST_RESPONSE)
+    cache.save_portfolio_detail("portfolio_001", PORTFOLIO_DETAIL_RESPONSE)
+
+    cache.clear_portfolio_details()
+
+    assert index_file.exists()
+    assert list((cache_dir / "details").iterdir()) == []
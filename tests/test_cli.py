@@ -1,10 +1,12 @@
 """Tests for CLI commands."""
 
-from unittest.mock import Mock, patch
+import json
+from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
 from click.testing import CliRunner
 
+from kubera.cache import load_portfolio_detail, save_portfolio_detail
 from kubera.cli import cli
 from kubera.exceptions import KuberaAPIError, KuberaAuthenticationError
 from tests.fixtures import PORTFOLIO_DETAIL_RESPONSE, PORTFOLIOS_LIST_RESPONSE
@@ -16,6 +18,13 @@ def runner():
     return CliRunner()
 
 
+@pytest.fixture(autouse=True)
+def cache_dir(tmp_path, monkeypatch):
+    """Keep CLI caches out of the real home directory."""
+    monkeypatch.setattr("kubera.cache.get_cache_dir", lambda: tmp_path)
+    return tmp_path
+
+
 @pytest.fixture
 def mock_client():
     """Create a mock Kubera client."""
@@ -27,14 +36,20 @@ def mock_client():
     return client
 
 
+@pytest.fixture
+def client_class(mock_client):
+    """Patch KuberaClient so the CLI constructs mock_client."""
+    with patch("kubera.client.KuberaClient", return_value=mock_client) as client_class:
+        yield client_class
+
+
 class TestListCommand:
     """Tests for 'kubera list' command."""
 
-    def test_list_success(self, runner, mock_client):
+    def test_list_success(self, runner, mock_client, client_class):
         """Test successful portfolio listing."""
-        with patch("kubera.cli.KuberaClient", return_value=mock_client):
-            with patch("kubera.cli.save_portfolio_cache"):
-                result = runner.invoke(cli, ["--api-key", "test", "--secret", "test", "list"])
+        with patch("kubera.cli.save_portfolio_cache"):
+            result = runner.invoke(cli, ["--api-key", "test", "--secret", "test", "list"])
 
         assert result.exit_code == 0
         assert "Test Portfolio 1" in result.output
@@ -42,17 +57,23 @@ class TestListCommand:
         mock_client.get_portfolios.assert_called_once()
         mock_client.close.assert_called_once()
 
-    def test_list_raw_output(self, runner, mock_client):
+    def test_list_closes_client_on_failure(self, runner, mock_client, client_class):
+        """Test that the client is still closed when a command exits with an error."""
+        mock_client.get_portfolios.side_effect = KuberaAPIError("Server error", 500)
+
+        result = runner.invoke(cli, ["--api-key", "test", "--secret", "test", "list"])
+
+        assert result.exit_code == 1
+        mock_client.close.assert_called_once()
+
+    def test_list_raw_output(self, runner, client_class):
         """Test portfolio listing with raw JSON output."""
-        with patch("kubera.cli.KuberaClient", return_value=mock_client):
-            with patch("kubera.cli.save_portfolio_cache"):
-                result = runner.invoke(
-                    cli, ["--api-key", "test", "--secret", "test", "list", "--raw"]
-                )
+        with patch("kubera.cli.save_portfolio_cache"):
+            result = runner.invoke(cli, ["--api-key", "test", "--secret", "test", "list", "--raw"])
 
         assert result.exit_code == 0
-        # Raw output should contain JSON
-        assert '"id"' in result.output or "portfolio_001" in result.output
+        # Raw output is the portfolio list as JSON
+        assert json.loads(result.output) == PORTFOLIOS_LIST_RESPONSE
 
     def test_list_auth_failure(self, runner):
         """Test list command with authentication failure."""
@@ -61,7 +82,7 @@ class TestListCommand:
             "Invalid credentials", 401
         )
 
-        with patch("kubera.cli.KuberaClient", return_value=mock_client):
+        with patch("kubera.client.KuberaClient", return_value=mock_client):
             result = runner.invoke(cli, ["--api-key", "bad", "--secret", "bad", "list"])
 
         assert result.exit_code == 1
@@ -70,7 +91,8 @@ class TestListCommand:
     def test_list_no_credentials(self, runner):
         """Test list command without credentials."""
         with patch(
-            "kubera.cli.KuberaClient", side_effect=KuberaAuthenticationError("No credentials", 401)
+            "kubera.client.KuberaClient",
+            side_effect=KuberaAuthenticationError("No credentials", 401),
         ):
             result = runner.invoke(cli, ["list"])
 
@@ -81,72 +103,82 @@ class TestListCommand:
 class TestShowCommand:
     """Tests for 'kubera show' command."""
 
-    def test_show_success(self, runner, mock_client):
+    def test_show_success(self, runner, mock_client, client_class):
         """Test successful portfolio show."""
-        with patch("kubera.cli.KuberaClient", return_value=mock_client):
-            with patch("kubera.cli.resolve_portfolio_id", return_value="portfolio_001"):
-                with patch(
-                    "kubera.cli.print_portfolio"
-                ):  # Mock the print function to avoid formatting errors
-                    result = runner.invoke(
-                        cli, ["--api-key", "test", "--secret", "test", "show", "portfolio_001"]
-                    )
-
-        if result.exit_code != 0:
-            print(f"Output: {result.output}")
-            if result.exception:
-                import traceback
-
-                traceback.print_exception(
-                    type(result.exception), result.exception, result.exception.__traceback__
+        with patch("kubera.cli.resolve_portfolio_id", return_value="portfolio_001"):
+            with patch(
+                "kubera.formatters.print_portfolio"
+            ):  # Mock the print function to avoid formatting errors
+                result = runner.invoke(
+                    cli, ["--api-key", "test", "--secret", "test", "show", "portfolio_001"]
                 )
-        assert result.exit_code == 0
+
+        assert result.exit_code == 0, result.output
         mock_client.get_portfolio.assert_called_once_with("portfolio_001")
         mock_client.close.assert_called_once()
 
-    def test_show_raw_output(self, runner, mock_client):
+    def test_show_uses_cached_detail(self, runner, mock_client, client_class):
+        """Test that a second show within the TTL is served from the cache."""
+        args = ["--api-key", "test", "--secret", "test", "show", "portfolio_001", "--raw"]
+        with patch("kubera.cli.resolve_portfolio_id", return_value="portfolio_001"):
+            first = runner.invoke(cli, args)
+            second = runner.invoke(cli, args)
+
+        assert first.exit_code == 0
+        assert second.exit_code == 0
+        assert second.output == first.output
+        mock_client.get_portfolio.assert_called_once_with("portfolio_001")
+
+    def test_show_no_cache(self, runner, mock_client, client_class):
+        """Test that --no-cache always fetches from the API."""
+        args = ["--api-key", "test", "--secret", "test", "show", "portfolio_001", "--raw"]
+        with patch("kubera.cli.resolve_portfolio_id", return_value="portfolio_001"):
+            runner.invoke(cli, args)
+            result = runner.invoke(cli, [*args, "--no-cache"])
+
+        assert result.exit_code == 0
+        assert mock_client.get_portfolio.call_count == 2
+
+    def test_show_raw_output(self, runner, client_class):
         """Test portfolio show with raw JSON output."""
-        with patch("kubera.cli.KuberaClient", return_value=mock_client):
-            with patch("kubera.cli.resolve_portfolio_id", return_value="portfolio_001"):
-                result = runner.invoke(
-                    cli, ["--api-key", "test", "--secret", "test", "show", "portfolio_001", "--raw"]
-                )
+        with patch("kubera.cli.resolve_portfolio_id", return_value="portfolio_001"):
+            result = runner.invoke(
+                cli, ["--api-key", "test", "--secret", "test", "show", "portfolio_001", "--raw"]
+            )
 
         assert result.exit_code == 0
-        # Raw output should contain JSON
-        assert '"asset"' in result.output or "asset" in result.output.lower()
+        # Raw output is the portfolio detail as JSON
+        assert json.loads(result.output) == PORTFOLIO_DETAIL_RESPONSE
 
-    def test_show_tree_output(self, runner, mock_client):
+    def test_show_tree_output(self, runner, client_class):
         """Test portfolio show with tree view."""
-        with patch("kubera.cli.KuberaClient", return_value=mock_client):
-            with patch("kubera.cli.resolve_portfolio_id", return_value="portfolio_001"):
-                with patch("kubera.cli.print_asset_tree"):  # Mock the tree print function
-                    result = runner.invoke(
-                        cli,
-                        [
-                            "--api-key",
-                            "test",
-                            "--secret",
-                            "test",
-                            "show",
-                            "portfolio_001",
-                            "--tree",
-                        ],
-                    )
+        with patch("kubera.cli.resolve_portfolio_id", return_value="portfolio_001"):
+            with patch("kubera.formatters.print_asset_tree"):  # Mock the tree print function
+                result = runner.invoke(
+                    cli,
+                    [
+                        "--api-key",
+                        "test",
+                        "--secret",
+                        "test",
+                        "show",
+                        "portfolio_001",
+                        "--tree",
+                    ],
+                )
 
         assert result.exit_code == 0
         # Tree output should have hierarchical structure indicators
         # The exact output depends on the formatter implementation
 
-    def test_show_not_found(self, runner, mock_client):
+    def test_show_not_found(self, runner, mock_client, client_class):
         """Test show command with non-existent portfolio."""
         mock_client.get_portfolio.side_effect = KuberaAPIError("Not found", 404)
 
-        with patch("kubera.cli.KuberaClient", return_value=mock_client):
-            with patch("kubera.cli.resolve_portfolio_id", return_value="nonexistent"):
-                result = runner.invoke(
-                    cli, ["--api-key", "test", "--secret", "test", "show", "nonexistent"]
-                )
+        with patch("kubera.cli.resolve_portfolio_id", return_value="nonexistent"):
+            result = runner.invoke(
+                cli, ["--api-key", "test", "--secret", "test", "show", "nonexistent"]
+            )
 
         assert result.exit_code == 1
         assert "Failed to fetch portfolio" in result.output
@@ -155,13 +187,12 @@ class TestShowCommand:
 class TestUpdateCommand:
     """Tests for 'kubera update' command."""
 
-    def test_update_value(self, runner, mock_client):
+    def test_update_value(self, runner, mock_client, client_class):
         """Test updating item value."""
-        with patch("kubera.cli.KuberaClient", return_value=mock_client):
-            result = runner.invoke(
-                cli,
-                ["--api-key", "test", "--secret", "test", "update", "asset_001", "--value", "5500"],
-            )
+        result = runner.invoke(
+            cli,
+            ["--api-key", "test", "--secret", "test", "update", "asset_001", "--value", "5500"],
+        )
 
         assert result.exit_code == 0
         mock_client.update_item.assert_called_once()
@@ -169,26 +200,25 @@ class TestUpdateCommand:
         assert call_args[0][0] == "asset_001"
         assert call_args[0][1]["value"] == 5500.0
 
-    def test_update_multiple_fields(self, runner, mock_client):
+    def test_update_multiple_fields(self, runner, mock_client, client_class):
         """Test updating multiple item fields."""
-        with patch("kubera.cli.KuberaClient", return_value=mock_client):
-            result = runner.invoke(
-                cli,
-                [
-                    "--api-key",
-                    "test",
-                    "--secret",
-                    "test",
-                    "update",
-                    "asset_001",
-                    "--value",
-                    "5500",
-                    "--name",
-                    "Updated Name",
-                    "--description",
-                    "New description",
-                ],
-            )
+        result = runner.invoke(
+            cli,
+            [
+                "--api-key",
+                "test",
+                "--secret",
+                "test",
+                "update",
+                "asset_001",
+                "--value",
+                "5500",
+                "--name",
+                "Updated Name",
+                "--description",
+                "New description",
+            ],
+        )
 
         assert result.exit_code == 0
         call_args = mock_client.update_item.call_args
@@ -197,25 +227,35 @@ class TestUpdateCommand:
         assert updates["name"] == "Updated Name"
         assert updates["description"] == "New description"
 
-    def test_update_permission_denied(self, runner, mock_client):
+    def test_update_invalidates_detail_cache(self, runner, mock_client, client_class, cache_dir):
+        """Test that a successful update drops cached portfolio details."""
+        save_portfolio_detail("portfolio_001", PORTFOLIO_DETAIL_RESPONSE)
+
+        result = runner.invoke(
+            cli,
+            ["--api-key", "test", "--secret", "test", "update", "asset_001", "--value", "5500"],
+        )
+
+        assert result.exit_code == 0
+        assert load_portfolio_detail("portfolio_001") is None
+
+    def test_update_permission_denied(self, runner, mock_client, client_class):
         """Test update with insufficient permissions."""
         mock_client.update_item.side_effect = KuberaAPIError("Permission denied", 403)
 
-        with patch("kubera.cli.KuberaClient", return_value=mock_client):
-            result = runner.invoke(
-                cli,
-                ["--api-key", "test", "--secret", "test", "update", "asset_001", "--value", "5500"],
-            )
+        result = runner.invoke(
+            cli,
+            ["--api-key", "test", "--secret", "test", "update", "asset_001", "--value", "5500"],
+        )
 
         assert result.exit_code == 1
         assert "Failed to update item" in result.output
 
-    def test_update_no_fields(self, runner, mock_client):
+    def test_update_no_fields(self, runner, client_class):
         """Test update command without any fields to update."""
-        with patch("kubera.cli.KuberaClient", return_value=mock_client):
-            result = runner.invoke(
-                cli, ["--api-key", "test", "--secret", "test", "update", "asset_001"]
-            )
+        result = runner.invoke(
+            cli, ["--api-key", "test", "--secret", "test", "update", "asset_001"]
+        )
 
         assert result.exit_code == 1
         assert (
@@ -225,12 +265,50 @@ class TestUpdateCommand:
         )
 
 
+class TestTestCommand:
+    """Tests for 'kubera test' command."""
+
+    def test_test_raw_fetches_sample_concurrently(self, runner, mock_client, client_class):
+        """Test that details for the first few portfolios are fetched via async calls."""
+        mock_client.aget_portfolio = AsyncMock(return_value=PORTFOLIO_DETAIL_RESPONSE)
+        mock_client.aclose = AsyncMock()
+
+        result = runner.invoke(cli, ["--api-key", "test", "--secret", "test", "test", "--raw"])
+
+        assert result.exit_code == 0
+        output = json.loads(result.output)
+        assert output["status"] == "success"
+        assert output["portfolios_count"] == 3
+        assert output["portfolios_checked"] == 3
+        assert [c.args[0] for c in mock_client.aget_portfolio.await_args_list] == [
+            "portfolio_001",
+            "portfolio_002",
+            "portfolio_003",
+        ]
+        mock_client.aclose.assert_awaited_once()
+        mock_client.get_portfolio.assert_not_called()
+
+    def test_test_raw_error_without_orjson(self, runner, mock_client, client_class, monkeypatch):
+        """Test raw error output falls back to the stdlib encoder."""
+        monkeypatch.setattr("kubera.formatters.orjson", None)
+        mock_client.get_portfolios.side_effect = KuberaAuthenticationError("Bad key", 401)
+
+        result = runner.invoke(cli, ["--api-key", "test", "--secret", "test", "test", "--raw"])
+
+        assert result.exit_code == 1
+        assert json.loads(result.output) == {
+            "status": "error",
+            "error": "Bad key",
+            "status_code": 401,
+        }
+
+
 class TestInteractiveCommand:
     """Tests for 'kubera interactive' command."""
 
     def test_interactive_help(self, runner):
         """Test interactive mode help display."""
-        with patch("kubera.cli.KuberaClient"):
+        with patch("kubera.client.KuberaClient"):
             # Interactive mode requires user input, so we just test it can start
             # Full interactive testing would require more complex mocking
             result = runner.invoke(cli, ["--help"])
@@ -264,7 +342,7 @@ class TestCLIOptions:
         monkeypatch.setenv("KUBERA_API_KEY", "env_key")
         monkeypatch.setenv("KUBERA_SECRET", "env_secret")
 
-        with patch("kubera.cli.KuberaClient") as mock_client_class:
+        with patch("kubera.client.KuberaClient") as mock_client_class:
             mock_client_class.return_value = mock_client
             with patch("kubera.cli.save_portfolio_cache"):
                 runner.invoke(cli, ["list"])
@@ -1,11 +1,13 @@
 """Tests for Kubera client."""
 
+import gc
 import os
 from unittest.mock import patch
 
 import pytest
 
 from kubera import KuberaClient
+from kubera.client import _load_user_env
 from kubera.exceptions import KuberaAuthenticationError
 
 
@@ -19,19 +21,13 @@ def test_client_init_with_credentials() -> None:
     assert client.timeout == 30.0
 
 
-def test_client_init_with_custom_base_url() -> None:
-    """Test client initialization with custom base URL."""
+def test_client_init_with_custom_base_url_and_timeout() -> None:
+    """Test client initialization with custom base URL and timeout."""
     client = KuberaClient(
-        api_key="test_key", secret="test_secret", base_url="https://custom.api.com"
+        api_key="test_key", secret="test_secret", base_url="https://custom.api.com", timeout=60.0
     )
 
     assert client.base_url == "https://custom.api.com"
-
-
-def test_client_init_with_custom_timeout() -> None:
-    """Test client initialization with custom timeout."""
-    client = KuberaClient(api_key="test_key", secret="test_secret", timeout=60.0)
-
     assert client.timeout == 60.0
 
 
@@ -55,6 +51,21 @@ def test_client_init_missing_credentials() -> None:
             assert "API credentials not found" in str(exc_info.value)
 
 
+def test_client_loads_user_env_once() -> None:
+    """Test that ~/.env is parsed at most once across client constructions."""
+    _load_user_env.cache_clear()
+    try:
+        with patch.dict(os.environ, {}, clear=True):
+            with patch("kubera.client._load_env_with_export_support") as mock_load:
+                for _ in range(3):
+                    with pytest.raises(KuberaAuthenticationError):
+                        KuberaClient()
+
+        mock_load.assert_called_once()
+    finally:
+        _load_user_env.cache_clear()
+
+
 def test_client_context_manager() -> None:
     """Test client as context manager."""
     with KuberaClient(api_key="test_key", secret="test_secret") as client:
@@ -62,12 +73,14 @@ def test_client_context_manager() -> None:
         assert client.api_key == "test_key"
 
 
-def test_build_url() -> None:
-    """Test URL building."""
-    client = KuberaClient(api_key="test_key", secret="test_secret")
+def test_http_clients_use_base_url() -> None:
+    """Test that request paths are resolved against the client's base URL."""
+    client = KuberaClient(
+        api_key="test_key", secret="test_secret", base_url="https://custom.api.com"
+    )
 
-    url = client._build_url("/api/v3/data/portfolio")
-    assert url == "https://api.kubera.com/api/v3/data/portfolio"
+    url = client._client.build_request("GET", "/api/v3/data/portfolio").url
+    assert url == "https://custom.api.com/api/v3/data/portfolio"
 
 
 def test_create_headers() -> None:
@@ -81,3 +94,39 @@ def test_create_headers() -> None:
     assert "x-signature" in headers
     assert "Content-Type" in headers
     assert headers["Content-Type"] == "application/json"
+
+
+def test_client_rate_limiter_default() -> None:
+    """Test that the client limits itself to the API's per-minute quota."""
+    client = KuberaClient(api_key="test_key", secret="test_secret")
+
+    assert client._rate_limiter is not None
+    assert client._rate_limiter.capacity == KuberaClient.RATE_LIMIT_PER_MINUTE
+
+
+def test_client_rate_limiter_disabled() -> None:
+    """Test that rate_limit=None disables client-side rate limiting."""
+    client = KuberaClient(api_key="test_key", secret="test_secret", rate_limit=None)
+
+    assert client._rate_limiter is None
+
+
+def test_client_closed_when_garbage_collected() -> None:
+    """Test that an unclosed client returns its connections once dropped."""
+    client = KuberaClient(api_key="test_key", secret="test_secret")
+    http_client = client._client
+
+    del client
+    gc.collect()
+
+    assert http_client.is_closed
+
+
+def test_client_close_detaches_finalizer() -> None:
+    """Test that an explicit close leaves nothing to run at exit."""
+    client = KuberaClient(api_key="test_key", secret="test_secret")
+
+    client.close()
+
+    assert client._client.is_closed
+    assert not client._finalizer.alive
@@ -1,6 +1,7 @@
 """Tests for Kubera client API methods using real response fixtures."""
 
-from unittest.mock import Mock, patch
+import json
+from unittest.mock import patch
 
 import httpx
 import pytest
@@ -12,6 +13,7 @@ from kubera.exceptions import (
     KuberaRateLimitError,
     KuberaValidationError,
 )
+from kubera.ratelimit import TokenBucket
 from tests.fixtures import (
     ERROR_RESPONSE_400,
     ERROR_RESPONSE_401,
@@ -20,14 +22,30 @@ from tests.fixtures import (
     PORTFOLIO_DETAIL_RESPONSE,
     PORTFOLIOS_LIST_RESPONSE,
     UPDATE_ITEM_RESPONSE,
+    FakeResponse,
     wrap_api_response,
 )
 
+# Successful API responses, wrapped once at import
+_WRAPPED_PORTFOLIOS = wrap_api_response(PORTFOLIOS_LIST_RESPONSE)
+_WRAPPED_DETAIL = wrap_api_response(PORTFOLIO_DETAIL_RESPONSE)
+_WRAPPED_UPDATE = wrap_api_response(UPDATE_ITEM_RESPONSE)
+
+
+@pytest.fixture(scope="module")
+def shared_client():
+    """Create one test client per module, since building its httpx.Client is slow."""
+    client = KuberaClient(api_key="test_key", secret="test_secret")
+    yield client
+    client.close()
+
 
 @pytest.fixture
-def client():
-    """Create a test client."""
-    return KuberaClient(api_key="test_key", secret="test_secret")
+def client(shared_client):
+    """Provide the shared test client with a fresh rate limiter."""
+    # 429 tests pause the limiter; don't let that delay the next test
+    shared_client._rate_limiter = TokenBucket(KuberaClient.RATE_LIMIT_PER_MINUTE)
+    return shared_client
 
 
 @pytest.fixture
@@ -35,11 +53,7 @@ def mock_response():
     """Create a mock HTTP response."""
 
     def _mock_response(status_code=200, json_data=None):
-        response = Mock(spec=httpx.Response)
-        response.status_code = status_code
-        response.json.return_value = json_data or {}
-        response.text = str(json_data) if json_data else ""
-        return response
+        return FakeResponse(status_code, content=json.dumps(json_data or {}).encode())
 
     return _mock_response
 
@@ -49,9 +63,9 @@ class TestGetPortfolios:
 
     def test_get_portfolios_success(self, client, mock_response):
         """Test successful portfolio list retrieval."""
-        response = mock_response(200, wrap_api_response(PORTFOLIOS_LIST_RESPONSE))
+        response = mock_response(200, _WRAPPED_PORTFOLIOS)
 
-        with patch.object(client._client, "get", return_value=response):
+        with patch.object(client._client, "request", return_value=response):
             portfolios = client.get_portfolios()
 
         assert len(portfolios) == 3
@@ -65,7 +79,7 @@ class TestGetPortfolios:
         """Test portfolio list when no portfolios exist."""
         response = mock_response(200, wrap_api_response([]))
 
-        with patch.object(client._client, "get", return_value=response):
+        with patch.object(client._client, "request", return_value=response):
             portfolios = client.get_portfolios()
 
         assert portfolios == []
@@ -74,22 +88,41 @@ class TestGetPortfolios:
         """Test portfolio list with authentication error."""
         response = mock_response(401, ERROR_RESPONSE_401)
 
-        with patch.object(client._client, "get", return_value=response):
+        with patch.object(client._client, "request", return_value=response):
             with pytest.raises(KuberaAuthenticationError) as exc_info:
                 client.get_portfolios()
 
         assert "Authentication failed" in str(exc_info.value)
         assert "IP address" in str(exc_info.value)
 
+    def test_get_portfolios_waits_for_rate_limiter(self, client, mock_response):
+        """Test that the request is sent only after the rate limiter is acquired."""
+        response = mock_response(200, _WRAPPED_PORTFOLIOS)
+        calls = []
+
+        with (
+            patch.object(
+                client._rate_limiter, "acquire", side_effect=lambda: calls.append("acquire")
+            ),
+            patch.object(
+                client._client,
+                "request",
+                side_effect=lambda *a, **k: calls.append("request") or response,
+            ),
+        ):
+            client.get_portfolios()
+
+        assert calls == ["acquire", "request"]
+
 
 class TestGetPortfolio:
     """Tests for get_portfolio() method."""
 
     def test_get_portfolio_success(self, client, mock_response):
         """Test successful portfolio detail retrieval."""
-        response = mock_response(200, wrap_api_response(PORTFOLIO_DETAIL_RESPONSE))
+        response = mock_response(200, _WRAPPED_DETAIL)
 
-        with patch.object(client._client, "get", return_value=response):
+        with patch.object(client._client, "request", return_value=response):
             portfolio = client.get_portfolio("portfolio_001")
 
         # Check structure
@@ -142,7 +175,7 @@ class TestGetPortfolio:
         error_response = {"errorCode": 404, "message": "Portfolio not found"}
         response = mock_response(404, error_response)
 
-        with patch.object(client._client, "get", return_value=response):
+        with patch.object(client._client, "request", return_value=response):
             with pytest.raises(KuberaAPIError) as exc_info:
                 client.get_portfolio("nonexistent")
 
@@ -154,10 +187,10 @@ class TestUpdateItem:
 
     def test_update_item_success(self, client, mock_response):
         """Test successful item update."""
-        response = mock_response(200, wrap_api_response(UPDATE_ITEM_RESPONSE))
+        response = mock_response(200, _WRAPPED_UPDATE)
         updates = {"value": 5500.00, "description": "Updated description"}
 
-        with patch.object(client._client, "post", return_value=response):
+        with patch.object(client._client, "request", return_value=response):
             result = client.update_item("asset_001", updates)
 
         assert result["id"] == "asset_001"
@@ -167,20 +200,33 @@ class TestUpdateItem:
 
     def test_update_item_partial(self, client, mock_response):
         """Test item update with only some fields."""
-        response = mock_response(200, wrap_api_response(UPDATE_ITEM_RESPONSE))
+        response = mock_response(200, _WRAPPED_UPDATE)
         updates = {"value": 5500.00}
 
-        with patch.object(client._client, "post", return_value=response):
+        with patch.object(client._client, "request", return_value=response):
             result = client.update_item("asset_001", updates)
 
         assert result is not None
 
+    def test_update_item_sends_signed_body(self, client, mock_response):
+        """Test that the compact JSON that was signed is the body sent."""
+        response = mock_response(200, _WRAPPED_UPDATE)
+        updates = {"value": 5500.00, "description": "Café"}
+
+        with patch.object(client._client, "request", return_value=response) as mock_post:
+            client.update_item("asset_001", updates)
+
+        assert mock_post.call_args.args == ("POST", "/api/v3/data/item/asset_001")
+        kwargs = mock_post.call_args.kwargs
+        assert kwargs["content"] == '{"value":5500.0,"description":"Café"}'.encode()
+        assert kwargs["headers"]["Content-Type"] == "application/json"
+
     def test_update_item_permission_denied(self, client, mock_response):
         """Test item update without proper permissions."""
         response = mock_response(403, ERROR_RESPONSE_403)
         updates = {"value": 5500.00}
 
-        with patch.object(client._client, "post", return_value=response):
+        with patch.object(client._client, "request", return_value=response):
             with pytest.raises(KuberaAPIError) as exc_info:
                 client.update_item("asset_001", updates)
 
@@ -193,7 +239,7 @@ class TestUpdateItem:
         response = mock_response(400, ERROR_RESPONSE_400)
         updates = {"value": "invalid"}
 
-        with patch.object(client._client, "post", return_value=response):
+        with patch.object(client._client, "request", return_value=response):
             with pytest.raises(KuberaValidationError) as exc_info:
                 client.update_item("asset_001", updates)
 
@@ -208,7 +254,7 @@ class TestErrorHandling:
         """Test rate limit exceeded error."""
         response = mock_response(429, ERROR_RESPONSE_429)
 
-        with patch.object(client._client, "get", return_value=response):
+        with patch.object(client._client, "request", return_value=response):
             with pytest.raises(KuberaRateLimitError) as exc_info:
                 client.get_portfolios()
 
@@ -216,12 +262,61 @@ class TestErrorHandling:
         assert "Rate limit exceeded" in str(exc_info.value)
         assert "30 req/min" in str(exc_info.value)
 
+    def test_rate_limit_error_pauses_limiter(self, client, mock_response):
+        """Test that a 429 holds further requests for the Retry-After delay."""
+        response = mock_response(429, ERROR_RESPONSE_429)
+        response.headers = httpx.Headers({"Retry-After": "12"})
+
+        with (
+            patch.object(client._client, "request", return_value=response),
+            patch.object(client._rate_limiter, "pause") as mock_pause,
+        ):
+            with pytest.raises(KuberaRateLimitError):
+                client.get_portfolios()
+
+        mock_pause.assert_called_once_with(12.0)
+
+    def test_rate_limit_error_retry_after(self, client, mock_response):
+        """Test that the Retry-After delay is exposed on the exception."""
+        response = mock_response(429, ERROR_RESPONSE_429)
+        response.headers = httpx.Headers({"Retry-After": "7"})
+
+        with patch.object(client._client, "request", return_value=response):
+            with pytest.raises(KuberaRateLimitError) as exc_info:
+                client.get_portfolios()
+
+        assert exc_info.value.retry_after == 7.0
+
+    def test_rate_limit_error_retry_after_http_date(self, client, mock_response):
+        """Test that an HTTP-date Retry-After is converted to seconds from now."""
+        response = mock_response(429, ERROR_RESPONSE_429)
+        response.headers = httpx.Headers({"Retry-After": "Wed, 21 Oct 2015 07:28:00 GMT"})
+
+        with (
+            patch("kubera.client.time.time", return_value=1445412470.0),
+            patch.object(client._client, "request", return_value=response),
+        ):
+            with pytest.raises(KuberaRateLimitError) as exc_info:
+                client.get_portfolios()
+
+        assert exc_info.value.retry_after == pytest.approx(10.0)
+
+    def test_rate_limit_error_without_retry_after(self, client, mock_response):
+        """Test that retry_after is None when the server gives no delay."""
+        response = mock_response(429, ERROR_RESPONSE_429)
+
+        with patch.object(client._client, "request", return_value=response):
+            with pytest.raises(KuberaRateLimitError) as exc_info:
+                client.get_portfolios()
+
+        assert exc_info.value.retry_after is None
+
     def test_generic_api_error(self, client, mock_response):
         """Test generic API error."""
         error_response = {"errorCode": 500, "message": "Internal server error"}
         response = mock_response(500, error_response)
 
-        with patch.object(client._client, "get", return_value=response):
+        with patch.object(client._client, "request", return_value=response):
             with pytest.raises(KuberaAPIError) as exc_info:
                 client.get_portfolios()
 
@@ -230,12 +325,9 @@ class TestErrorHandling:
 
     def test_error_without_json(self, client):
         """Test error response that doesn't contain valid JSON."""
-        response = Mock(spec=httpx.Response)
-        response.status_code = 500
-        response.text = "Internal Server Error"
-        response.json.side_effect = Exception("Not JSON")
+        response = FakeResponse(500, content=b"Internal Server Error")
 
-        with patch.object(client._client, "get", return_value=response):
+        with patch.object(client._client, "request", return_value=response):
             with pytest.raises(KuberaAPIError) as exc_info:
                 client.get_portfolios()
 
@@ -247,10 +339,10 @@ class TestResponseHandling:
 
     def test_wrapped_response(self, client, mock_response):
         """Test extraction of data from wrapped response."""
-        wrapped = wrap_api_response(PORTFOLIOS_LIST_RESPONSE)
+        wrapped = _WRAPPED_PORTFOLIOS
         response = mock_response(200, wrapped)
 
-        with patch.object(client._client, "get", return_value=response):
+        with patch.object(client._client, "request", return_value=response):
             portfolios = client.get_portfolios()
 
         # Should extract the "data" field
@@ -260,8 +352,39 @@ class TestResponseHandling:
         """Test handling of response without data wrapper."""
         response = mock_response(200, PORTFOLIOS_LIST_RESPONSE)
 
-        with patch.object(client._client, "get", return_value=response):
+        with patch.object(client._client, "request", return_value=response):
             portfolios = client.get_portfolios()
 
         # Should work even without wrapper
         assert portfolios == PORTFOLIOS_LIST_RESPONSE
+
+    def test_response_without_orjson(self, client, mock_response):
+        """Test that responses decode with the stdlib when orjson is not installed."""
+        response = mock_response(200, _WRAPPED_PORTFOLIOS)
+
+        with (
+            patch("kubera._json.orjson", None),
+            patch.object(client._client, "request", return_value=response),
+        ):
+            portfolios = client.get_portfolios()
+
+        assert portfolios == PORTFOLIOS_LIST_RESPONSE
+
+    def test_other_success_status(self, client, mock_response):
+        """Test that any 2xx response is treated as success."""
+        response = mock_response(201, _WRAPPED_UPDATE)
+
+        with patch.object(client._client, "request", return_value=response):
+            result = client.update_item("asset_001", {"value": 5500.00})
+
+        assert result == UPDATE_ITEM_RESPONSE
+
+    def test_empty_success_response(self, client, mock_response):
+        """Test that a success response without a body returns None."""
+        response = mock_response(204)
+        response.content = b""
+
+        with patch.object(client._client, "request", return_value=response):
+            result = client.update_item("asset_001", {"value": 5500.00})
+
+        assert result is None
@@ -1,6 +1,9 @@
 """Tests for Kubera client async API methods."""
 
-from unittest.mock import AsyncMock, Mock, patch
+import asyncio
+import json
+import threading
+from unittest.mock import AsyncMock, patch
 
 import httpx
 import pytest
@@ -10,19 +13,50 @@ from kubera.exceptions import (
     KuberaAPIError,
     KuberaAuthenticationError,
 )
+from kubera.ratelimit import TokenBucket
 from tests.fixtures import (
     ERROR_RESPONSE_401,
     PORTFOLIO_DETAIL_RESPONSE,
     PORTFOLIOS_LIST_RESPONSE,
     UPDATE_ITEM_RESPONSE,
+    FakeResponse,
     wrap_api_response,
 )
 
+# Successful API responses, wrapped once at import
+_WRAPPED_PORTFOLIOS = wrap_api_response(PORTFOLIOS_LIST_RESPONSE)
+_WRAPPED_EMPTY = wrap_api_response([])
+_WRAPPED_DETAIL = wrap_api_response(PORTFOLIO_DETAIL_RESPONSE)
+_WRAPPED_UPDATE = wrap_api_response(UPDATE_ITEM_RESPONSE)
+
+
+@pytest.fixture(scope="module")
+def shared_client():
+    """Create one test client per module, since building its httpx.Client is slow."""
+    client = KuberaClient(api_key="test_key", secret="test_secret")
+    yield client
+    client.close()
+
+
+@pytest.fixture
+def client(shared_client):
+    """Provide the shared test client with a fresh rate limiter."""
+    shared_client._rate_limiter = TokenBucket(KuberaClient.RATE_LIMIT_PER_MINUTE)
+    return shared_client
+
+
+@pytest.fixture(scope="module")
+def shared_async_http():
+    """Create one httpx.AsyncClient mock per module, since spec introspection is slow."""
+    return AsyncMock(spec=httpx.AsyncClient)
+
 
 @pytest.fixture
-def client():
-    """Create a test client."""
-    return KuberaClient(api_key="test_key", secret="test_secret")
+def async_http(client, shared_async_http):
+    """Route the client's async requests to the shared mock, reset for this test."""
+    shared_async_http.reset_mock(return_value=True, side_effect=True)
+    with patch.object(client, "_get_async_client", return_value=shared_async_http):
+        yield shared_async_http
 
 
 @pytest.fixture
@@ -30,11 +64,7 @@ def mock_async_response():
     """Create a mock async HTTP response."""
 
     def _mock_response(status_code=200, json_data=None):
-        response = Mock(spec=httpx.Response)
-        response.status_code = status_code
-        response.json.return_value = json_data or {}
-        response.text = str(json_data) if json_data else ""
-        return response
+        return FakeResponse(status_code, content=json.dumps(json_data or {}).encode())
 
     return _mock_response
 
@@ -43,91 +73,117 @@ def mock_async_response():
 class TestAsyncGetPortfolios:
     """Tests for aget_portfolios() async method."""
 
-    async def test_aget_portfolios_success(self, client, mock_async_response):
+    async def test_aget_portfolios_success(self, client, mock_async_response, async_http):
         """Test async portfolio list retrieval."""
-        response = mock_async_response(200, wrap_api_response(PORTFOLIOS_LIST_RESPONSE))
+        response = mock_async_response(200, _WRAPPED_PORTFOLIOS)
+        async_http.request.return_value = response
 
-        mock_client = AsyncMock(spec=httpx.AsyncClient)
-        mock_client.get.return_value = response
-
-        with patch.object(client, "_get_async_client", return_value=mock_client):
-            portfolios = await client.aget_portfolios()
+        portfolios = await client.aget_portfolios()
 
         assert len(portfolios) == 3
         assert portfolios[0]["id"] == "portfolio_001"
         assert portfolios[0]["name"] == "Test Portfolio 1"
 
-    async def test_aget_portfolios_empty(self, client, mock_async_response):
+    async def test_aget_portfolios_empty(self, client, mock_async_response, async_http):
         """Test async portfolio list when empty."""
-        response = mock_async_response(200, wrap_api_response([]))
-
-        mock_client = AsyncMock(spec=httpx.AsyncClient)
-        mock_client.get.return_value = response
+        response = mock_async_response(200, _WRAPPED_EMPTY)
+        async_http.request.return_value = response
 
-        with patch.object(client, "_get_async_client", return_value=mock_client):
-            portfolios = await client.aget_portfolios()
+        portfolios = await client.aget_portfolios()
 
         assert portfolios == []
 
-    async def test_aget_portfolios_auth_error(self, client, mock_async_response):
+    async def test_aget_portfolios_auth_error(self, client, mock_async_response, async_http):
         """Test async portfolio list with auth error."""
         response = mock_async_response(401, ERROR_RESPONSE_401)
+        async_http.request.return_value = response
 
-        mock_client = AsyncMock(spec=httpx.AsyncClient)
-        mock_client.get.return_value = response
-
-        with patch.object(client, "_get_async_client", return_value=mock_client):
-            with pytest.raises(KuberaAuthenticationError):
-                await client.aget_portfolios()
+        with pytest.raises(KuberaAuthenticationError, match="Authentication failed"):
+            await client.aget_portfolios()
 
 
 @pytest.mark.asyncio
 class TestAsyncGetPortfolio:
     """Tests for aget_portfolio() async method."""
 
-    async def test_aget_portfolio_success(self, client, mock_async_response):
+    async def test_aget_portfolio_success(self, client, mock_async_response, async_http):
         """Test async portfolio detail retrieval."""
-        response = mock_async_response(200, wrap_api_response(PORTFOLIO_DETAIL_RESPONSE))
-
-        mock_client = AsyncMock(spec=httpx.AsyncClient)
-        mock_client.get.return_value = response
+        response = mock_async_response(200, _WRAPPED_DETAIL)
+        async_http.request.return_value = response
 
-        with patch.object(client, "_get_async_client", return_value=mock_client):
-            portfolio = await client.aget_portfolio("portfolio_001")
+        portfolio = await client.aget_portfolio("portfolio_001")
 
         assert "asset" in portfolio
         assert len(portfolio["asset"]) == 3
         assert portfolio["asset"][0]["type"] == "bank"
 
-    async def test_aget_portfolio_not_found(self, client, mock_async_response):
+    async def test_aget_portfolio_not_found(self, client, mock_async_response, async_http):
         """Test async portfolio detail with non-existent ID."""
         error_response = {"errorCode": 404, "message": "Portfolio not found"}
         response = mock_async_response(404, error_response)
+        async_http.request.return_value = response
 
-        mock_client = AsyncMock(spec=httpx.AsyncClient)
-        mock_client.get.return_value = response
-
-        with patch.object(client, "_get_async_client", return_value=mock_client):
-            with pytest.raises(KuberaAPIError) as exc_info:
-                await client.aget_portfolio("nonexistent")
+        with pytest.raises(KuberaAPIError) as exc_info:
+            await client.aget_portfolio("nonexistent")
 
         assert exc_info.value.status_code == 404
 
 
+@pytest.mark.asyncio
+class TestAsyncGetAllPortfolios:
+    """Tests for aget_all_portfolios() async method."""
+
+    async def test_aget_all_portfolios_fetches_each_detail(self, client):
+        """Test that details are fetched for every portfolio, in list order."""
+        summaries = [{"id": "p1"}, {"id": "p2"}, {"id": "p3"}]
+
+        async def detail(portfolio_id):
+            await asyncio.sleep(0.01 if portfolio_id == "p1" else 0)
+            return {"id": portfolio_id}
+
+        with (
+            patch.object(client, "aget_portfolios", AsyncMock(return_value=summaries)),
+            patch.object(client, "aget_portfolio", side_effect=detail),
+        ):
+            portfolios = await client.aget_all_portfolios()
+
+        assert [p["id"] for p in portfolios] == ["p1", "p2", "p3"]
+
+    async def test_aget_all_portfolios_bounds_concurrency(self, client):
+        """Test that no more than `concurrency` detail requests run at once."""
+        summaries = [{"id": f"p{i}"} for i in range(6)]
+        in_flight = 0
+        peak = 0
+
+        async def detail(portfolio_id):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            return {"id": portfolio_id}
+
+        with (
+            patch.object(client, "aget_portfolios", AsyncMock(return_value=summaries)),
+            patch.object(client, "aget_portfolio", side_effect=detail),
+        ):
+            portfolios = await client.aget_all_portfolios(concurrency=2)
+
+        assert len(portfolios) == 6
+        assert peak == 2
+
+
 @pytest.mark.asyncio
 class TestAsyncUpdateItem:
     """Tests for aupdate_item() async method."""
 
-    async def test_aupdate_item_success(self, client, mock_async_response):
+    async def test_aupdate_item_success(self, client, mock_async_response, async_http):
         """Test async item update."""
-        response = mock_async_response(200, wrap_api_response(UPDATE_ITEM_RESPONSE))
+        response = mock_async_response(200, _WRAPPED_UPDATE)
         updates = {"value": 5500.00}
+        async_http.request.return_value = response
 
-        mock_client = AsyncMock(spec=httpx.AsyncClient)
-        mock_client.post.return_value = response
-
-        with patch.object(client, "_get_async_client", return_value=mock_client):
-            result = await client.aupdate_item("asset_001", updates)
+        result = await client.aupdate_item("asset_001", updates)
 
         assert result["id"] == "asset_001"
         assert result["value"]["amount"] == 5500.00
@@ -143,14 +199,70 @@ class TestAsyncContextManager:
             assert isinstance(client, KuberaClient)
             assert client.api_key == "test_key"
 
+    async def test_async_context_manager_opens_shared_client(self):
+        """Test that entering the async context creates one pooled client."""
+        async with KuberaClient(
+            api_key="test_key", secret="test_secret", base_url="https://custom.api.com"
+        ) as client:
+            async_client = client._async_clients.get(asyncio.get_running_loop())
+            assert async_client is not None
+            assert async_client.base_url == "https://custom.api.com"
+            assert client._get_async_client() is async_client
+
     async def test_async_close(self):
         """Test async client cleanup."""
         client = KuberaClient(api_key="test_key", secret="test_secret")
 
         # Create async client
-        _ = client._get_async_client()
-        assert client._async_client is not None
+        async_client = client._get_async_client()
+        assert not async_client.is_closed
 
-        # Close should clean up
+        # Close should clean up and let a later call open a fresh client
+        await client.aclose()
+        assert async_client.is_closed
+        reopened = client._get_async_client()
+        assert reopened is not async_client
         await client.aclose()
-        # Note: We can't easily verify the client was closed without more mocking
+        assert reopened.is_closed
+
+
+def test_async_client_per_event_loop() -> None:
+    """Test that each event loop gets its own async client."""
+    client = KuberaClient(api_key="test_key", secret="test_secret")
+
+    async def _get() -> httpx.AsyncClient:
+        async_client = client._get_async_client()
+        assert client._get_async_client() is async_client
+        await client.aclose()
+        return async_client
+
+    first = asyncio.run(_get())
+    second = asyncio.run(_get())
+
+    assert first is not second
+    assert first.is_closed and second.is_closed
+
+
+def test_async_close_closes_clients_of_other_loops() -> None:
+    """Test that aclose also closes clients opened on idle and running loops."""
+    client = KuberaClient(api_key="test_key", secret="test_secret")
+
+    async def _open() -> httpx.AsyncClient:
+        return client._get_async_client()
+
+    idle_loop = asyncio.new_event_loop()
+    running_loop = asyncio.new_event_loop()
+    thread = threading.Thread(target=running_loop.run_forever)
+    thread.start()
+    try:
+        idle_client = idle_loop.run_until_complete(_open())
+        running_client = asyncio.run_coroutine_threadsafe(_open(), running_loop).result()
+
+        asyncio.run(client.aclose())
+
+        assert idle_client.is_closed and running_client.is_closed
+    finally:
+        running_loop.call_soon_threadsafe(running_loop.stop)
+        thread.join()
+        running_loop.close()
+        idle_loop.close()
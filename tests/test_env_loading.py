@@ -1,124 +1,102 @@
 """Tests for environment variable loading with export support."""
 
 import os
-import tempfile
-from pathlib import Path
+from unittest.mock import patch
+
+import pytest
 
 from kubera.client import _load_env_with_export_support
 
 
-def test_load_env_standard_format() -> None:
-    """Test loading .env file in standard format (KEY=value)."""
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".env", delete=False) as f:
-        f.write("KUBERA_API_KEY=test_key\n")
-        f.write("KUBERA_SECRET=test_secret\n")
-        temp_path = f.name
+@pytest.fixture
+def env_file(tmp_path):
+    """Write .env contents to a temporary file with the Kubera variables cleared.
 
-    try:
-        # Clear any existing values
-        os.environ.pop("KUBERA_API_KEY", None)
-        os.environ.pop("KUBERA_SECRET", None)
+    The environment is restored afterwards, including any variables the loader set.
+    """
 
-        _load_env_with_export_support(temp_path)
+    def _write(content: str) -> str:
+        path = tmp_path / ".env"
+        path.write_text(content)
+        return str(path)
 
-        assert os.getenv("KUBERA_API_KEY") == "test_key"
-        assert os.getenv("KUBERA_SECRET") == "test_secret"
-    finally:
-        Path(temp_path).unlink()
+    with patch.dict(os.environ):
         os.environ.pop("KUBERA_API_KEY", None)
         os.environ.pop("KUBERA_SECRET", None)
+        yield _write
 
 
-def test_load_env_export_format() -> None:
-    """Test loading .env file with export statements."""
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".env", delete=False) as f:
-        f.write("export KUBERA_API_KEY=test_key_export\n")
-        f.write("export KUBERA_SECRET=test_secret_export\n")
-        temp_path = f.name
+def test_load_env_standard_format(env_file) -> None:
+    """Test loading .env file in standard format (KEY=value)."""
+    _load_env_with_export_support(env_file("KUBERA_API_KEY=test_key\nKUBERA_SECRET=test_secret\n"))
 
-    try:
-        # Clear any existing values
-        os.environ.pop("KUBERA_API_KEY", None)
-        os.environ.pop("KUBERA_SECRET", None)
+    assert os.getenv("KUBERA_API_KEY") == "test_key"
+    assert os.getenv("KUBERA_SECRET") == "test_secret"
 
-        _load_env_with_export_support(temp_path)
 
-        assert os.getenv("KUBERA_API_KEY") == "test_key_export"
-        assert os.getenv("KUBERA_SECRET") == "test_secret_export"
-    finally:
-        Path(temp_path).unlink()
-        os.environ.pop("KUBERA_API_KEY", None)
-        os.environ.pop("KUBERA_SECRET", None)
+def test_load_env_export_format(env_file) -> None:
+    """Test loading .env file with export statements."""
+    _load_env_with_export_support(
+        env_file("export KUBERA_API_KEY=test_key_export\nexport KUBERA_SECRET=test_secret_export\n")
+    )
 
+    assert os.getenv("KUBERA_API_KEY") == "test_key_export"
+    assert os.getenv("KUBERA_SECRET") == "test_secret_export"
 
-def test_load_env_mixed_format() -> None:
-    """Test loading .env file with both formats and comments."""
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".env", delete=False) as f:
-        f.write("# This is a comment\n")
-        f.write("export KUBERA_API_KEY=test_key_mixed\n")
-        f.write("\n")
-        f.write("KUBERA_SECRET=test_secret_mixed\n")
-        f.write("# Another comment\n")
-        temp_path = f.name
-
-    try:
-        # Clear any existing values
-        os.environ.pop("KUBERA_API_KEY", None)
-        os.environ.pop("KUBERA_SECRET", None)
 
-        _load_env_with_export_support(temp_path)
+def test_load_env_mixed_format(env_file) -> None:
+    """Test loading .env file with both formats and comments."""
+    _load_env_with_export_support(
+        env_file(
+            "# This is a comment\n"
+            "export KUBERA_API_KEY=test_key_mixed\n"
+            "\n"
+            "KUBERA_SECRET=test_secret_mixed\n"
+            "# Another comment\n"
+        )
+    )
 
-        assert os.getenv("KUBERA_API_KEY") == "test_key_mixed"
-        assert os.getenv("KUBERA_SECRET") == "test_secret_mixed"
-    finally:
-        Path(temp_path).unlink()
-        os.environ.pop("KUBERA_API_KEY", None)
-        os.environ.pop("KUBERA_SECRET", None)
+    assert os.getenv("KUBERA_API_KEY") == "test_key_mixed"
+    assert os.getenv("KUBERA_SECRET") == "test_secret_mixed"
 
 
-def test_load_env_quoted_values() -> None:
+def test_load_env_quoted_values(env_file) -> None:
     """Test loading .env file with quoted values."""
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".env", delete=False) as f:
-        f.write('export KUBERA_API_KEY="test_key_quoted"\n')
-        f.write("KUBERA_SECRET='test_secret_quoted'\n")
-        temp_path = f.name
+    _load_env_with_export_support(
+        env_file("export KUBERA_API_KEY=\"test_key_quoted\"\nKUBERA_SECRET='test_secret_quoted'\n")
+    )
 
-    try:
-        # Clear any existing values
-        os.environ.pop("KUBERA_API_KEY", None)
-        os.environ.pop("KUBERA_SECRET", None)
+    assert os.getenv("KUBERA_API_KEY") == "test_key_quoted"
+    assert os.getenv("KUBERA_SECRET") == "test_secret_quoted"
 
-        _load_env_with_export_support(temp_path)
 
-        assert os.getenv("KUBERA_API_KEY") == "test_key_quoted"
-        assert os.getenv("KUBERA_SECRET") == "test_secret_quoted"
-    finally:
-        Path(temp_path).unlink()
-        os.environ.pop("KUBERA_API_KEY", None)
-        os.environ.pop("KUBERA_SECRET", None)
+def test_load_env_skips_malformed_lines(env_file) -> None:
+    """Test that lines without an assignment are ignored and spacing is tolerated."""
+    _load_env_with_export_support(
+        env_file(
+            "export PATH\n"
+            "not an assignment\n"
+            "export KUBERA_API_KEY = test_key_spaced \n"
+            "KUBERA_SECRET=test_secret_spaced\n"
+        )
+    )
+
+    assert os.getenv("KUBERA_API_KEY") == "test_key_spaced"
+    assert os.getenv("KUBERA_SECRET") == "test_secret_spaced"
 
 
-def test_load_env_respects_existing_env_vars() -> None:
+def test_load_env_respects_existing_env_vars(env_file) -> None:
     """Test that existing environment variables take precedence."""
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".env", delete=False) as f:
-        f.write("export KUBERA_API_KEY=file_key\n")
-        f.write("export KUBERA_SECRET=file_secret\n")
-        temp_path = f.name
-
-    try:
-        # Set environment variables before loading
-        os.environ["KUBERA_API_KEY"] = "env_key"
-        os.environ["KUBERA_SECRET"] = "env_secret"
-
-        _load_env_with_export_support(temp_path)
-
-        # Environment variables should not be overwritten
-        assert os.getenv("KUBERA_API_KEY") == "env_key"
-        assert os.getenv("KUBERA_SECRET") == "env_secret"
-    finally:
-        Path(temp_path).unlink()
-        os.environ.pop("KUBERA_API_KEY", None)
-        os.environ.pop("KUBERA_SECRET", None)
+    path = env_file("export KUBERA_API_KEY=file_key\nexport KUBERA_SECRET=file_secret\n")
+    # Set environment variables before loading
+    os.environ["KUBERA_API_KEY"] = "env_key"
+    os.environ["KUBERA_SECRET"] = "env_secret"
+
+    _load_env_with_export_support(path)
+
+    # Environment variables should not be overwritten
+    assert os.getenv("KUBERA_API_KEY") == "env_key"
+    assert os.getenv("KUBERA_SECRET") == "env_secret"
 
 
 def test_load_env_nonexistent_file() -> None:
@@ -0,0 +1,28 @@
+"""Tests for Kubera API exceptions."""
+
+import copy
+import pickle
+
+from kubera.exceptions import KuberaAPIError, KuberaAuthenticationError, KuberaRateLimitError
+
+
+def test_api_error_survives_pickle_and_copy() -> None:
+    """Test that status_code is kept when an error crosses a process boundary or is copied."""
+    error = KuberaAuthenticationError("Authentication failed", 401)
+
+    for restored in (pickle.loads(pickle.dumps(error)), copy.copy(error)):
+        assert type(restored) is KuberaAuthenticationError
+        assert restored.message == "Authentication failed"
+        assert restored.status_code == 401
+        assert str(restored) == "Authentication failed"
+
+
+def test_rate_limit_error_survives_pickle() -> None:
+    """Test that retry_after is kept through a pickle round trip."""
+    error = KuberaRateLimitError("Rate limit exceeded", 429, retry_after=12.0)
+
+    restored = pickle.loads(pickle.dumps(error))
+
+    assert isinstance(restored, KuberaAPIError)
+    assert restored.status_code == 429
+    assert restored.retry_after == 12.0
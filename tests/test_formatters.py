@@ -0,0 +1,186 @@
+"""Tests for CLI output formatters."""
+
+import contextlib
+import io
+import json
+from unittest.mock import patch
+
+from kubera import formatters
+from tests.fixtures import PORTFOLIO_DETAIL_RESPONSE, PORTFOLIOS_LIST_RESPONSE
+
+
+def test_print_portfolios_raw(capsys) -> None:
+    """Test that raw portfolio output is indented JSON."""
+    formatters.print_portfolios(PORTFOLIOS_LIST_RESPONSE, raw=True)
+
+    out = capsys.readouterr().out
+    assert json.loads(out) == PORTFOLIOS_LIST_RESPONSE
+    assert out.startswith("[\n  {")
+    assert out.endswith("\n")
+
+
+def test_print_portfolio_raw_without_orjson(capsys) -> None:
+    """Test that raw output falls back to the stdlib encoder."""
+    with patch("kubera.formatters.orjson", None):
+        formatters.print_portfolio(PORTFOLIO_DETAIL_RESPONSE, raw=True)
+
+    out = capsys.readouterr().out
+    assert out == json.dumps(PORTFOLIO_DETAIL_RESPONSE, indent=2) + "\n"
+
+
+def test_print_portfolios_raw_to_text_only_stdout() -> None:
+    """Test that raw output works when stdout has no binary buffer."""
+    out = io.StringIO()
+    with contextlib.redirect_stdout(out):
+        formatters.print_portfolios(PORTFOLIOS_LIST_RESPONSE, raw=True)
+
+    assert json.loads(out.getvalue()) == PORTFOLIOS_LIST_RESPONSE
+    assert out.getvalue().endswith("\n")
+
+
+def test_print_raw_matches_with_and_without_orjson() -> None:
+    """Test that raw output is the same text whichever encoder is used."""
+    data = [{"name": "Café", "value": 1.5, "tags": []}]
+    outputs = []
+    for module in (formatters.orjson, None):
+        out = io.StringIO()
+        with patch("kubera.formatters.orjson", module), contextlib.redirect_stdout(out):
+            formatters.print_portfolios(data, raw=True)
+        outputs.append(out.getvalue())
+
+    assert outputs[0] == outputs[1]
+    assert '"Café"' in outputs[1]
+
+
+def test_group_by_sheet_excludes_parents_from_totals() -> None:
+    """Test that grouping keeps every item but totals skip parent accounts."""
+    items = [
+        {"id": "parent", "sheetName": "Investments", "value": {"amount": 300}},
+        {
+            "id": "a",
+            "sheetName": "Investments",
+            "parent": {"id": "parent"},
+            "value": {"amount": 100},
+        },
+        {
+            "id": "b",
+            "sheetName": "Investments",
+            "parent": {"id": "parent"},
+            "value": {"amount": 200},
+        },
+        {"id": "c", "sheetName": "Cash", "value": {"amount": None}},
+        {"id": "d", "value": {"amount": 5}},
+    ]
+
+    groups, totals = formatters._group_by_sheet(items)
+
+    assert list(groups) == ["Investments", "Cash", "Other"]
+    assert [i["id"] for i in groups["Investments"]] == ["parent", "a", "b"]
+    assert totals == {"Investments": 300, "Cash": 0, "Other": 5}
+
+
+def test_print_sheet_detail_totals_and_columns(capsys) -> None:
+    """Test sheet totals skip parents and columns appear only where data exists."""
+    items = [
+        {"id": "acct", "name": "Brokerage", "sectionName": "Taxable", "value": {"amount": 300}},
+        {
+            "id": "a",
+            "name": "Fund A",
+            "sectionName": "Taxable",
+            "parent": {"id": "acct"},
+            "ticker": "AAA",
+            "value": {"amount": 200, "currency": "USD"},
+            "cost": {"amount": 100, "currency": "USD"},
+        },
+        {"id": "b", "name": "Savings", "sectionName": "Cash", "value": {"amount": 50}},
+    ]
+
+    with patch.dict("os.environ", {"COLUMNS": "160"}):
+        formatters.print_sheet_detail(items, "Investments", "asset", "My Portfolio")
+
+    out = capsys.readouterr().out
+    assert "Total Value: USD 250.00 | Cost Basis: USD 100.00" in out
+    assert "Total Items: 2 across 2 section(s)" in out
+    assert "Brokerage" not in out
+    taxable, cash = out.split("Taxable", 1)[1].split("Cash", 1)
+    assert "Ticker" in taxable and "Gain %" in taxable and "+100.00%" in taxable
+    assert "Ticker" not in cash and "Cost Basis" not in cash
+
+
+def test_print_sheet_detail_totals_are_exactly_rounded(capsys) -> None:
+    """Test that totals do not lose small amounts next to large ones."""
+    items = [
+        {"id": str(i), "name": f"Item {i}", "value": {"amount": amount}}
+        for i, amount in enumerate([1e16, 1.0, -1e16])
+    ]
+
+    formatters.print_sheet_detail(items, "Cash", "asset", "My Portfolio")
+
+    assert "Total Value: USD 1.00" in capsys.readouterr().out
+
+
+def test_print_portfolio_insurance_total_is_exactly_rounded(capsys) -> None:
+    """Test that the insurance total across sheets does not lose small amounts."""
+    insurance = [
+        {
+            "id": str(i),
+            "name": f"Policy {i}",
+            "sheetName": f"Sheet {i}",
+            "value": {"amount": amount},
+        }
+        for i, amount in enumerate([1e16, 1.0, -1e16])
+    ]
+
+    formatters.print_portfolio({"name": "Main", "insurance": insurance})
+
+    assert "Insurance (3 items) - Total: USD 1.00" in capsys.readouterr().out
+
+
+def test_group_by_sheet_handles_interleaved_sheets() -> None:
+    """Test that sheets are merged even when their items are not contiguous."""
+    items = [
+        {"id": "a", "sheetName": "Cash", "value": {"amount": 1}},
+        {"id": "b", "sheetName": "Stocks", "value": {"amount": 2}},
+        {"id": "c", "sheetName": "Cash", "value": {"amount": 4}},
+    ]
+
+    groups, totals = formatters._group_by_sheet(items)
+
+    assert {sheet: [i["id"] for i in group] for sheet, group in groups.items()} == {
+        "Cash": ["a", "c"],
+        "Stocks": ["b"],
+    }
+    assert totals == {"Cash": 5, "Stocks": 2}
+
+
+def test_print_sheet_detail_handles_null_name(capsys) -> None:
+    """Test that an item whose name is null is shown as N/A."""
+    items = [{"id": "1", "name": None, "value": {"amount": 10, "currency": "USD"}}]
+
+    formatters.print_sheet_detail(items, "Cash", "asset", "My Portfolio")
+
+    assert "N/A" in capsys.readouterr().out
+
+
+def test_print_sheet_detail_shows_bracketed_names_literally(capsys) -> None:
+    """Test that item names are not interpreted as Rich markup."""
+    items = [{"id": "a", "name": "[bold]Old[/bold] Account", "value": {"amount": 10}}]
+
+    with patch.dict("os.environ", {"COLUMNS": "160"}):
+        formatters.print_sheet_detail(items, "Cash", "asset", "My Portfolio")
+
+    assert "[bold]Old[/bold] Account" in capsys.readouterr().out
+
+
+def test_print_portfolio_writes_output_once() -> None:
+    """Test that a multi-section portfolio is written to stdout in a single call."""
+    item = {"id": "a1", "name": "Cash", "sheetName": "Bank", "value": {"amount": 10.0}}
+    portfolio = {"name": "Main", "netWorth": 10.0, "asset": [item], "debt": [item]}
+
+    stdout = io.StringIO()
+    with patch("sys.stdout", stdout), patch.object(stdout, "write", wraps=stdout.write) as write:
+        formatters.print_portfolio(portfolio)
+
+    assert write.call_count == 1
+    assert "Assets" in stdout.getvalue()
+    assert "Debts" in stdout.getvalue()
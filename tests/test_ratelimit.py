@@ -0,0 +1,131 @@
+"""Tests for client-side rate limiting."""
+
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from kubera.ratelimit import TokenBucket
+
+
+@pytest.fixture
+def clock():
+    """Patch the monotonic clock used by the token bucket."""
+    now = [1000.0]
+    with patch("kubera.ratelimit.time.monotonic", side_effect=lambda: now[0]):
+        yield now
+
+
+def test_bucket_allows_burst_up_to_capacity(clock) -> None:
+    """Test that a full bucket lets capacity requests through without waiting."""
+    bucket = TokenBucket(3, period=60.0)
+
+    assert [bucket.reserve() for _ in range(3)] == [0.0, 0.0, 0.0]
+
+
+def test_bucket_delays_when_empty(clock) -> None:
+    """Test that requests beyond capacity wait for refill, in arrival order."""
+    bucket = TokenBucket(3, period=60.0)
+    for _ in range(3):
+        bucket.reserve()
+
+    assert bucket.reserve() == pytest.approx(20.0)
+    assert bucket.reserve() == pytest.approx(40.0)
+
+
+def test_bucket_refills_over_time(clock) -> None:
+    """Test that tokens refill at capacity per period, capped at capacity."""
+    bucket = TokenBucket(3, period=60.0)
+    for _ in range(3):
+        bucket.reserve()
+
+    clock[0] += 20.0
+    assert bucket.reserve() == 0.0
+
+    clock[0] += 3600.0
+    assert [bucket.reserve() for _ in range(3)] == [0.0, 0.0, 0.0]
+    assert bucket.reserve() > 0
+
+
+def test_acquire_sleeps_for_delay(clock) -> None:
+    """Test that acquire only sleeps once the bucket is empty."""
+    bucket = TokenBucket(1, period=60.0)
+
+    with patch("kubera.ratelimit.time.sleep") as mock_sleep:
+        bucket.acquire()
+        mock_sleep.assert_not_called()
+        bucket.acquire()
+        mock_sleep.assert_called_once_with(pytest.approx(60.0))
+
+
+def test_aacquire_sleeps_for_delay(clock) -> None:
+    """Test that aacquire awaits asyncio.sleep once the bucket is empty."""
+    bucket = TokenBucket(1, period=60.0)
+
+    with patch("asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
+        asyncio.run(bucket.aacquire())
+        mock_sleep.assert_not_called()
+        asyncio.run(bucket.aacquire())
+        mock_sleep.assert_awaited_once_with(pytest.approx(60.0))
+
+
+def test_pause_holds_requests_then_releases_single_file(clock) -> None:
+    """Test that pausing delays everyone until the deadline, then spaces them out."""
+    bucket = TokenBucket(3, period=60.0)
+
+    bucket.pause(30.0)
+
+    assert bucket.reserve() == pytest.approx(30.0)
+    assert bucket.reserve() == pytest.approx(50.0)
+
+    clock[0] += 45.0
+    assert bucket.reserve() == pytest.approx(25.0)
+
+
+def test_pause_without_delay_drains_bucket(clock) -> None:
+    """Test that a pause with no Retry-After lets one request through at a time."""
+    bucket = TokenBucket(3, period=60.0)
+
+    bucket.pause()
+
+    assert bucket.reserve() == 0.0
+    assert bucket.reserve() == pytest.approx(20.0)
+
+
+def test_pause_requeues_requests_already_waiting(clock) -> None:
+    """Test that a caller sleeping when the pause arrives waits out the pause too."""
+    bucket = TokenBucket(1, period=1.0)
+    bucket.reserve()
+    sleeps = []
+
+    def sleep(seconds):
+        sleeps.append(seconds)
+        if len(sleeps) == 1:
+            # A 429 arrives while this caller waits for its 1 s slot
+            bucket.pause(30.0)
+        clock[0] += seconds
+
+    with patch("kubera.ratelimit.time.sleep", side_effect=sleep):
+        bucket.acquire()
+
+    assert sleeps == [pytest.approx(1.0), pytest.approx(29.0)]
+    assert clock[0] == pytest.approx(1030.0)
+
+
+def test_apause_requeues_requests_already_waiting(clock) -> None:
+    """Test that an async caller sleeping when the pause arrives waits out the pause too."""
+    bucket = TokenBucket(1, period=1.0)
+    bucket.reserve()
+    sleeps = []
+
+    async def sleep(seconds):
+        sleeps.append(seconds)
+        if len(sleeps) == 1:
+            bucket.pause(30.0)
+        clock[0] += seconds
+
+    with patch("asyncio.sleep", side_effect=sleep):
+        asyncio.run(bucket.aacquire())
+
+    assert sleeps == [pytest.approx(1.0), pytest.approx(29.0)]
+    assert clock[0] == pytest.approx(1030.0)